@@ -0,0 +1,72 @@
+"""add current_status to job_application
+
+Revision ID: 5e2b9c41a7d0
+Revises: d74bbfa378b1
+Create Date: 2026-10-18 10:12:31.204117
+
+"""
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2b9c41a7d0'
+down_revision: Union[str, Sequence[str], None] = 'd74bbfa378b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_application', sa.Column('current_status', postgresql.ENUM('SAVED', 'APPLIED', 'INTERVIEWED', 'OFFERED', 'REJECTED', 'ACCEPTED', 'WITHDRAWN', name='status', create_type=False), nullable=True))
+
+    # backfill in primary key ranges, committing each batch so the table is never locked for long
+    with op.get_context().autocommit_block():
+        # every batch looks up timelines by job_application_id, without this index each one scans the table
+        op.create_index('ix_job_timeline_job_application_id', 'job_timeline', ['job_application_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+        connection = op.get_bind()
+        lower = uuid.UUID(int=0)
+        while True:
+            ids = connection.execute(
+                sa.text("SELECT id FROM job_application WHERE id > :lower ORDER BY id LIMIT :batch_size"),
+                {"lower": lower, "batch_size": BACKFILL_BATCH_SIZE},
+            ).scalars().all()
+            if not ids:
+                break
+            upper = ids[-1]
+            connection.execute(
+                sa.text(
+                    """
+                    UPDATE job_application AS app
+                    SET current_status = latest.status
+                    FROM (
+                        SELECT DISTINCT ON (job_application_id) job_application_id, status
+                        FROM job_timeline
+                        WHERE deleted_at IS NULL
+                          AND job_application_id > :lower AND job_application_id <= :upper
+                        ORDER BY job_application_id, created_at DESC, id DESC
+                    ) AS latest
+                    WHERE app.id = latest.job_application_id
+                    """
+                ),
+                {"lower": lower, "upper": upper},
+            )
+            lower = upper
+
+        # built concurrently, like the backfill it must not block writes to the table
+        op.create_index('ix_job_application_user_status_created', 'job_application', ['user_uid', 'current_status', 'created_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_job_application_user_status_created', table_name='job_application', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('job_application', 'current_status')
+    op.drop_index('ix_job_timeline_job_application_id', table_name='job_timeline', if_exists=True)
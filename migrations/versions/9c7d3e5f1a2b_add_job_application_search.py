@@ -0,0 +1,137 @@
+"""add job_application_search
+
+Revision ID: 9c7d3e5f1a2b
+Revises: 5e2b9c41a7d0
+Create Date: 2026-10-18 14:03:52.618240
+
+"""
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9c7d3e5f1a2b'
+down_revision: Union[str, Sequence[str], None] = '5e2b9c41a7d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# frozen copy of the search document function and triggers as of this revision
+CREATE_SEARCH_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION refresh_job_application_search(app_id uuid) RETURNS void
+    LANGUAGE sql AS $$
+        INSERT INTO job_application_search (job_application_id, document)
+        SELECT app.id,
+               setweight(to_tsvector('simple', coalesce(app.job_title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(app.company_name, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(app.location, '')), 'B')
+            || setweight(to_tsvector('simple', coalesce((
+                   SELECT string_agg(notes, ' ') FROM job_timeline
+                   WHERE job_application_id = app.id AND deleted_at IS NULL
+               ), '')), 'C')
+            || setweight(to_tsvector('simple', coalesce((
+                   SELECT string_agg(notes, ' ') FROM job_interviews
+                   WHERE job_application_id = app.id AND deleted_at IS NULL
+               ), '')), 'C')
+        FROM job_application AS app
+        WHERE app.id = app_id
+        ON CONFLICT (job_application_id) DO UPDATE SET document = EXCLUDED.document
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION job_application_search_refresh() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM refresh_job_application_search(NEW.id);
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION job_application_search_refresh_parent() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM refresh_job_application_search(OLD.job_application_id);
+        END IF;
+        IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.job_application_id IS DISTINCT FROM OLD.job_application_id) THEN
+            PERFORM refresh_job_application_search(NEW.job_application_id);
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE TRIGGER job_application_search_refresh
+    AFTER INSERT OR UPDATE OF job_title, company_name, location ON job_application
+    FOR EACH ROW EXECUTE FUNCTION job_application_search_refresh()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER job_timeline_search_refresh
+    AFTER INSERT OR DELETE OR UPDATE OF notes, deleted_at, job_application_id ON job_timeline
+    FOR EACH ROW EXECUTE FUNCTION job_application_search_refresh_parent()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER job_interviews_search_refresh
+    AFTER INSERT OR DELETE OR UPDATE OF notes, deleted_at, job_application_id ON job_interviews
+    FOR EACH ROW EXECUTE FUNCTION job_application_search_refresh_parent()
+    """,
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    op.create_table('job_application_search',
+    sa.Column('job_application_id', sa.UUID(), nullable=False),
+    sa.Column('document', postgresql.TSVECTOR(), nullable=True),
+    sa.ForeignKeyConstraint(['job_application_id'], ['job_application.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_application_id')
+    )
+    for statement in CREATE_SEARCH_TRIGGERS:
+        op.execute(statement)
+
+    # dropped by mistake in fb9a9582561a, the trigram fallback depends on them
+    op.execute("CREATE INDEX IF NOT EXISTS idx_company_trgm ON job_application USING gin (company_name gin_trgm_ops);")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_title_trgm ON job_application USING gin (job_title gin_trgm_ops);")
+
+    # build documents for existing rows in primary key ranges, one commit per batch
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        lower = uuid.UUID(int=0)
+        while True:
+            ids = connection.execute(
+                sa.text("SELECT id FROM job_application WHERE id > :lower ORDER BY id LIMIT :batch_size"),
+                {"lower": lower, "batch_size": BACKFILL_BATCH_SIZE},
+            ).scalars().all()
+            if not ids:
+                break
+            upper = ids[-1]
+            connection.execute(
+                sa.text("SELECT count(refresh_job_application_search(id)) FROM job_application WHERE id > :lower AND id <= :upper"),
+                {"lower": lower, "upper": upper},
+            )
+            lower = upper
+
+    # after the backfill, so the bulk load does not maintain the GIN index row by row
+    op.create_index('ix_job_application_search_document', 'job_application_search', ['document'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS job_interviews_search_refresh ON job_interviews;")
+    op.execute("DROP TRIGGER IF EXISTS job_timeline_search_refresh ON job_timeline;")
+    op.execute("DROP TRIGGER IF EXISTS job_application_search_refresh ON job_application;")
+    op.execute("DROP FUNCTION IF EXISTS job_application_search_refresh_parent();")
+    op.execute("DROP FUNCTION IF EXISTS job_application_search_refresh();")
+    op.execute("DROP FUNCTION IF EXISTS refresh_job_application_search(uuid);")
+    op.execute("DROP INDEX IF EXISTS idx_company_trgm;")
+    op.execute("DROP INDEX IF EXISTS idx_title_trgm;")
+    op.drop_index('ix_job_application_search_document', table_name='job_application_search', postgresql_using='gin')
+    op.drop_table('job_application_search')
@@ -0,0 +1,48 @@
+"""add composite partial indexes
+
+Revision ID: b41f6a8e2c95
+Revises: 9c7d3e5f1a2b
+Create Date: 2026-10-18 16:47:09.331582
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41f6a8e2c95'
+down_revision: Union[str, Sequence[str], None] = '9c7d3e5f1a2b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE = sa.text('deleted_at IS NULL')
+
+# (name, table, columns, where)
+INDEXES = [
+    ('ix_job_application_live_user_created', 'job_application', ['user_uid', 'created_at', 'id'], LIVE),
+    ('ix_job_application_live_created', 'job_application', ['created_at', 'id'], LIVE),
+    ('ix_job_timeline_job_application_id', 'job_timeline', ['job_application_id'], None),
+    ('ix_job_timeline_live_app_event_date', 'job_timeline', ['job_application_id', 'event_date', 'id'], LIVE),
+    ('ix_job_timeline_live_app_created', 'job_timeline', ['job_application_id', 'created_at'], LIVE),
+    ('ix_job_interviews_job_application_id', 'job_interviews', ['job_application_id'], None),
+    ('ix_job_interviews_live_app_date', 'job_interviews', ['job_application_id', 'interview_date', 'id'], LIVE),
+    ('ix_users_email', 'users', ['email'], None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction, and keeps the tables writable while building
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_where=where, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
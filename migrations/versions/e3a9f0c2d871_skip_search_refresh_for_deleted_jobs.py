@@ -0,0 +1,52 @@
+"""skip search refresh for deleted jobs
+
+Revision ID: e3a9f0c2d871
+Revises: b41f6a8e2c95
+Create Date: 2026-10-18 19:02:41.274816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a9f0c2d871'
+down_revision: Union[str, Sequence[str], None] = 'b41f6a8e2c95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REFRESH_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_job_application_search(app_id uuid) RETURNS void
+LANGUAGE sql AS $$
+    INSERT INTO job_application_search (job_application_id, document)
+    SELECT app.id,
+           setweight(to_tsvector('simple', coalesce(app.job_title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(app.company_name, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(app.location, '')), 'B')
+        || setweight(to_tsvector('simple', coalesce((
+               SELECT string_agg(notes, ' ') FROM job_timeline
+               WHERE job_application_id = app.id AND deleted_at IS NULL
+           ), '')), 'C')
+        || setweight(to_tsvector('simple', coalesce((
+               SELECT string_agg(notes, ' ') FROM job_interviews
+               WHERE job_application_id = app.id AND deleted_at IS NULL
+           ), '')), 'C')
+    FROM job_application AS app
+    WHERE app.id = app_id{guard}
+    ON CONFLICT (job_application_id) DO UPDATE SET document = EXCLUDED.document
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # soft-deleted applications are never searched, so cascades skip the rebuild
+    op.execute(REFRESH_FUNCTION.format(guard=" AND app.deleted_at IS NULL"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(REFRESH_FUNCTION.format(guard=""))
@@ -3,14 +3,20 @@ from src.job_application.routes import job_application_router
 from src.auth.routes import auth_router
 from src.interview.routes import job_interview_router
 from src.job_timeline.routes import job_timeline_router
+from src.metrics.routes import metrics_router
+from src.search.routes import search_router
 from contextlib import asynccontextmanager
-from src.db.main import init_db
+from src.auth.hashing import password_hasher
+from src.db.redis import start_revocation_listener, stop_revocation_listener, close_redis
 from .middleware import register_middleware
 @asynccontextmanager
 async def life_span(app:FastAPI):
     print(f"server is starting ... ")
-    await init_db()
+    start_revocation_listener()
     yield
+    await stop_revocation_listener()
+    await close_redis()
+    password_hasher.shutdown()
     print(f"server has been stopped ... ")
     
 version = "v1"
@@ -18,6 +24,7 @@ version = "v1"
 app = FastAPI(
     title="Job Trail",
     version=version,
+    lifespan=life_span,
 )
 
 register_middleware(app)
@@ -25,4 +32,6 @@ register_middleware(app)
 app.include_router(job_application_router, prefix=f"/api/{version}/job_applications", tags=["job_applications"])
 app.include_router(auth_router, prefix=f"/api/{version}/auth", tags=["Auth"])
 app.include_router(job_interview_router, prefix=f"/api/{version}", tags=["Job Interviews"])
-app.include_router(job_timeline_router, prefix=f"/api/{version}", tags=["Job Timelines"])
\ No newline at end of file
+app.include_router(job_timeline_router, prefix=f"/api/{version}", tags=["Job Timelines"])
+app.include_router(metrics_router, prefix=f"/api/{version}/metrics", tags=["Metrics"])
+app.include_router(search_router, prefix=f"/api/{version}/search", tags=["Search"])
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""Measure how a burst of logins affects the latency of other endpoints.
+
+    python -m src.auth.benchmark --email user@example.com --password secret --logins 16 --seconds 10
+
+Logs in as an existing account, then for each mode keeps ``--logins``
+concurrent login loops running against the app in this process while one
+client times GET /api/v1/job_applications/user. ``idle`` is the probe with
+no login load. ``inline`` verifies passwords on the event loop, as login
+did before PasswordHasher. ``executor`` is the current path. Needs httpx
+from requirements-dev.txt.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import httpx
+from src import app
+from src.db.main import async_engine
+from .hashing import password_hasher
+
+API = "http://localhost/api/v1"
+
+
+async def run_inline(func, *args):
+    return func(*args)
+
+
+async def probe(client: httpx.AsyncClient, headers: dict, deadline: float) -> list[float]:
+    timings = []
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.get(f"{API}/job_applications/user", headers=headers)
+        response.raise_for_status()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def login_loop(client: httpx.AsyncClient, credentials: dict, deadline: float) -> int:
+    logins = 0
+    while time.perf_counter() < deadline:
+        response = await client.post(f"{API}/auth/login", json=credentials)
+        response.raise_for_status()
+        logins += 1
+    return logins
+
+
+async def measure(client: httpx.AsyncClient, credentials: dict, headers: dict, logins: int, seconds: float) -> tuple[float, list[float]]:
+    deadline = time.perf_counter() + seconds
+    timings, *counts = await asyncio.gather(
+        probe(client, headers, deadline),
+        *(login_loop(client, credentials, deadline) for _ in range(logins)),
+    )
+    return sum(counts) / seconds, timings
+
+
+async def benchmark(email: str, password: str, logins: int, seconds: float) -> None:
+    credentials = {"email": email, "password": password}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.post(f"{API}/auth/login", json=credentials)
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        await probe(client, headers, time.perf_counter() + 1)  # warm the caches and the pool
+
+        modes = {"idle": (False, 0), "inline": (True, logins), "executor": (False, logins)}
+        print(f"{'mode':<9} {'logins/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        try:
+            for name, (inline, concurrent_logins) in modes.items():
+                if inline:
+                    password_hasher._run = run_inline  # type: ignore[method-assign]
+                try:
+                    rate, timings = await measure(client, credentials, headers, concurrent_logins, seconds)
+                finally:
+                    if inline:
+                        del password_hasher._run
+                p99 = statistics.quantiles(timings, n=100, method="inclusive")[98] if len(timings) > 1 else timings[0]
+                print(f"{name:<9} {rate:>9.1f} {statistics.median(timings):>8.2f} {p99:>8.2f} {max(timings):>8.2f}")
+        finally:
+            password_hasher.shutdown()
+            await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.email, args.password, args.logins, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Measure password hashing throughput to size login capacity.
+
+    python -m src.auth.calibrate --rounds 10 11 12 13
+
+Each cost is timed on a single core; the node estimate assumes the
+hashing pool gets one core per worker.
+"""
+import argparse
+import os
+import time
+from src.config import Config
+from .utils import build_pass_context
+
+
+def measure(scheme: str, rounds: int, duration: float) -> float:
+    context = build_pass_context(scheme, rounds)
+    context.hash("calibration")  # warm up backend loading
+
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        context.hash("calibration")
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scheme", default=Config.PASSWORD_HASH_SCHEME)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[Config.PASSWORD_HASH_ROUNDS])
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds to hash at each cost")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    print(f"scheme={args.scheme} cores={cores} configured_rounds={Config.PASSWORD_HASH_ROUNDS}")
+    print(f"{'rounds':>6} {'ms/hash':>9} {'hashes/s/core':>14} {'hashes/s/node':>14}")
+    for rounds in args.rounds:
+        rate = measure(args.scheme, rounds, args.duration)
+        print(f"{rounds:>6} {1000 / rate:>9.1f} {rate:>14.1f} {rate * cores:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,17 @@ from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 
 from src.interview.service import JobInterviewService
-from .utils import decode_token
+from .utils import verify_token
 from fastapi.exceptions import HTTPException
 from src.db.redis import token_in_blocklist
-from src.db.main import get_session
+from src.db.main import get_session, read_session_maker
 from sqlmodel.ext.asyncio.session import AsyncSession
 from .services import UserService
-from typing import Any, List
+from typing import Any, AsyncGenerator, List
 from src.db.models import User
 from src.job_application.services import JobApplicationService
 from src.job_timeline.services import JobTimelineService
+import uuid
 
 user_service = UserService()
 
@@ -28,8 +29,8 @@ class TokenBearer(HTTPBearer):
                 status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated"
             )
         token = creds.credentials
-        token_data = decode_token(token)
-        if not self.token_valid(token):
+        token_data = verify_token(token)
+        if token_data is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Invalid or expired token"
             )
@@ -40,7 +41,7 @@ class TokenBearer(HTTPBearer):
         #         detail="Please provide an access token"
         #     )
 
-        if await token_in_blocklist(token_data["jti"]):
+        if await token_in_blocklist(token_data["jti"], token_data.get("exp")):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail={
@@ -49,15 +50,12 @@ class TokenBearer(HTTPBearer):
                 },
             )
         self.verify_token_data(token_data)
+        request.state.token_details = token_data
 
         return token_data  # type: ignore
 
     def token_valid(self, token: str) -> bool:
-        token_data = decode_token(token)
-        if token_data is not None:
-            return True
-        else:
-            return False
+        return verify_token(token) is not None
 
     def verify_token_data(self, token_data):
         raise NotImplementedError("Please override this method in child classes")
@@ -81,21 +79,53 @@ class RefreshTokenBearer(TokenBearer):
             )
 
 
+access_token_bearer = AccessTokenBearer()
+
+
 async def get_current_user(
-    token_detail: dict = Depends(AccessTokenBearer()),
+    token_detail: dict = Depends(access_token_bearer),
     session: AsyncSession = Depends(get_session),
 ):
-    user_email = token_detail["user"]["email"]
-    user = await user_service.get_user_by_email(user_email, session)
+    user_id = token_detail["user"].get("user_id")
+    if user_id is None:
+        return await user_service.get_user_by_email(token_detail["user"]["email"], session)
+    user = await user_service.get_cached_user_by_id(uuid.UUID(user_id), session)
     return user
 
 
+async def get_read_session(
+    token_details: dict = Depends(access_token_bearer),
+) -> AsyncGenerator[AsyncSession, None]:
+    # read-only routes go to the replica unless the caller wrote within the sticky window
+    session_maker = await read_session_maker(token_details["user"].get("user_id"))
+    async with session_maker() as session:
+        yield session
+
+
 class RoleChecker:
-    def __init__(self, allowed_roles: List[str]) -> None:
-        self.allowed_roles = allowed_roles
+    """Gate a route on the caller's role.
 
-    def __call__(self, current_user: User = Depends(get_current_user)) -> Any:
-        if current_user.user_type.value in self.allowed_roles:
+    With ``claims_only`` the role is read from the access token's
+    ``user_type`` claim and no user row is loaded, so a role change takes
+    effect on the next token refresh (or immediately by revoking the token).
+    Tokens issued before the claim existed fall back to loading the user.
+    """
+
+    def __init__(self, allowed_roles: List[str], claims_only: bool = False) -> None:
+        self.allowed_roles = allowed_roles
+        self.claims_only = claims_only
+
+    async def __call__(
+        self,
+        token_details: dict = Depends(access_token_bearer),
+        session: AsyncSession = Depends(get_session),
+    ) -> Any:
+        user_type = token_details["user"].get("user_type") if self.claims_only else None
+        if user_type is None:
+            current_user = await get_current_user(token_details, session)
+            user_type = current_user.user_type.value if current_user is not None else None
+
+        if user_type in self.allowed_roles:
             return True
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,59 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+from src.config import Config
+from .utils import generate_pass_hash, verify_password
+
+
+class PasswordHasher:
+    """Runs the blocking passlib calls on a worker pool.
+
+    The semaphore caps how many hashes are in flight, so a burst of logins
+    queues on the event loop instead of monopolising the pool.
+    """
+
+    def __init__(self, executor: str, workers: int, max_concurrency: int) -> None:
+        self.executor_kind = executor
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _run(self, func, *args):
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(generate_pass_hash, password)
+
+    async def verify(self, password: str, hash: str) -> bool:
+        return await self._run(verify_password, password, hash)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._semaphore = None
+
+
+password_hasher = PasswordHasher(
+    executor=Config.PASSWORD_HASH_EXECUTOR,
+    workers=Config.PASSWORD_HASH_WORKERS,
+    max_concurrency=Config.PASSWORD_HASH_MAX_CONCURRENCY,
+)
@@ -1,23 +1,26 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, status
 from src.db.redis import add_jti_to_blocklist
-from .dependencies import AccessTokenBearer
-from .schemas import UserCreateModel, UserModel, UserLoginModel, UserJobAppsModel
+from .schemas import UserCreateModel, UserModel, UserLoginModel, UserProfileModel
 from .services import UserService
-from .utils import create_access_token, decode_token, verify_password
+from .utils import create_access_token, decode_token, password_needs_update, user_claims
+from .hashing import password_hasher
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi.exceptions import HTTPException
 from src.db.main import get_session
 from datetime import timedelta
 from fastapi.responses import JSONResponse
-from src.auth.dependencies import AccessTokenBearer
-from .dependencies import RefreshTokenBearer, get_current_user, RoleChecker
+from src.auth.dependencies import access_token_bearer
+from .dependencies import RefreshTokenBearer, get_current_user, get_job_service, get_read_session, RoleChecker
+from src.db.models import User
+from src.job_application.schemas import JobApplication
+from src.job_application.services import JobApplicationService
 from datetime import datetime
+import uuid
 
 
-access_token_bearer = AccessTokenBearer()
 auth_router = APIRouter()
 users_service = UserService()
-role_checker_standard = Depends(RoleChecker(['ADMIN', 'USER', 'GUEST']))
+role_checker_standard = Depends(RoleChecker(['ADMIN', 'USER', 'GUEST'], claims_only=True))
 
 REFRESH_TOKEN_EXPIRY = 2
 
@@ -31,26 +34,25 @@ async def create_user_account(user_data : UserCreateModel, session:AsyncSession
     return new_user
 
 @auth_router.post('/login')
-async def login_users(login_data:UserLoginModel, session: AsyncSession = Depends(get_session)):
+async def login_users(login_data:UserLoginModel, background_tasks:BackgroundTasks, session: AsyncSession = Depends(get_session)):
     email = login_data.email
     password = login_data.password
     
     user = await users_service.get_user_by_email(email, session)
+    # end the read so the pooled connection is not held while the hash waits for a worker
+    await session.commit()
     if user is not None:
-        password_valid = verify_password(password, user.password_hash)
+        password_valid = await password_hasher.verify(password, user.password_hash)
         if password_valid :
+            if password_needs_update(user.password_hash):
+                background_tasks.add_task(users_service.rehash_password, user.id, password)
+
             access_token = create_access_token(
-                user_data={
-                    'email':user.email,
-                    'user_id':str(user.id)
-                }
+                user_data=user_claims(user)
             )
             
             refresh_token = create_access_token(
-                user_data={
-                    'email':user.email,
-                    'user_id':str(user.id)
-                },
+                user_data=user_claims(user),
                 refresh=True,
                 expiry=timedelta(days=REFRESH_TOKEN_EXPIRY)
             )
@@ -73,12 +75,17 @@ async def login_users(login_data:UserLoginModel, session: AsyncSession = Depends
     )
 
 @auth_router.get("/refresh_token")
-async def get_new_access_token(token_details:dict = Depends(RefreshTokenBearer())):
+async def get_new_access_token(token_details:dict = Depends(RefreshTokenBearer()), session: AsyncSession = Depends(get_session)):
     expiry_timestamp = token_details['exp']
     
     if datetime.fromtimestamp(expiry_timestamp)>datetime.now():
+        # re-read the user so role changes land in the new access token's claims
+        user = await users_service.get_user_by_id(uuid.UUID(token_details['user']['user_id']), session)
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User no longer exists")
+
         new_access_token = create_access_token(
-            user_data=token_details['user']
+            user_data=user_claims(user)
         )
         
         return JSONResponse(
@@ -89,15 +96,30 @@ async def get_new_access_token(token_details:dict = Depends(RefreshTokenBearer()
     
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired token")
 
-@auth_router.get('/me',response_model=UserJobAppsModel, dependencies=[role_checker_standard])
-async def get_me(token_detail: dict = Depends(AccessTokenBearer()), session: AsyncSession = Depends(get_session)):
-    user = await get_current_user(token_detail=token_detail, session=session)
-    return user
+@auth_router.get('/me',response_model=UserProfileModel, dependencies=[role_checker_standard])
+async def get_me(
+    include_applications: bool = False,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
+    job_application_service: JobApplicationService = Depends(get_job_service),
+):
+    status_counts = await job_application_service.count_user_jobs_by_status(current_user.id, session)
+    profile = UserProfileModel(
+        **dict(UserModel.model_validate(current_user, from_attributes=True)),
+        total_applications=sum(status_counts.values()),
+        status_counts=status_counts,
+    )
+
+    # kept for older clients, new ones page through /job_applications/user instead
+    if include_applications:
+        user = await users_service.get_user_with_applications(current_user.id, session)
+        profile.job_applications = [JobApplication.model_validate(job, from_attributes=True) for job in user.job_applications]  # type: ignore[union-attr]
+    return profile
 
 @auth_router.get("/logout", dependencies=[role_checker_standard])
-async def revoke_token(token_details:dict=Depends(AccessTokenBearer())):
+async def revoke_token(token_details:dict=Depends(access_token_bearer)):
     jti = token_details['jti']
-    await add_jti_to_blocklist(jti)
+    await add_jti_to_blocklist(jti, token_details['exp'])
     return JSONResponse(
         content={
             "message": "Logged out succesfully"
@@ -2,7 +2,7 @@ from enum import Enum
 from pydantic import BaseModel, Field
 import uuid
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 from src.job_application.schemas import JobApplication
 class UserTypes(Enum):
     ADMIN = "ADMIN"
@@ -29,8 +29,10 @@ class UserModel(BaseModel):
     created_at:datetime 
     updated_at:datetime
     
-class UserJobAppsModel(UserModel):
-    job_applications:List[JobApplication]
+class UserProfileModel(UserModel):
+    total_applications:int
+    status_counts:Dict[str, int]
+    job_applications:Optional[List[JobApplication]] = None
 
 class UserLoginModel(BaseModel) :
     email: str = Field(max_length=40)
@@ -1,24 +1,70 @@
 from src.db.models import User
+from src.config import Config
+from src.core.cache import TTLCache
 from .schemas import UserCreateModel
-from .utils import generate_pass_hash
+from .hashing import password_hasher
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select
+from sqlmodel import select, update
+from sqlalchemy import event
+from sqlalchemy.orm import selectinload
+from src.db.main import async_session_maker
+import uuid
+
+# resolved users keyed by primary key, shared by every request in this worker
+user_cache = TTLCache(maxsize=Config.USER_CACHE_MAXSIZE, ttl=Config.USER_CACHE_TTL)
+
+
+def invalidate_user(user_id: uuid.UUID) -> None:
+    user_cache.pop(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _evict_user(mapper, connection, target: User) -> None:
+    invalidate_user(target.id)
+
+
 class UserService:
     async def get_user_by_email(self,email:str, session:AsyncSession):
         statement = select(User).where(User.email == email)
         result = await session.exec(statement)
         return result.first()
-    
+
+    async def get_user_by_id(self, user_id:uuid.UUID, session:AsyncSession):
+        return await session.get(User, user_id)
+
+    async def get_user_with_applications(self, user_id:uuid.UUID, session:AsyncSession):
+        return await session.get(User, user_id, options=[selectinload(User.job_applications)])  # type: ignore[arg-type]
+
+    async def get_cached_user_by_id(self, user_id:uuid.UUID, session:AsyncSession):
+        user = user_cache.get(user_id)
+        if user is None:
+            user = await self.get_user_by_id(user_id, session)
+            if user is not None:
+                # detach it so a rollback or close of this request's session cannot expire the shared copy
+                session.expunge(user)
+                user_cache.set(user_id, user)
+        return user
+
     async def user_exists(self, email:str, session:AsyncSession):
         user = await self.get_user_by_email(email, session)
         return True if user is not None else False
-    
+
     async def create_user(self, user_data:UserCreateModel, session:AsyncSession):
         user_data_dict = user_data.model_dump()
         new_user = User(
             **user_data_dict
         )
-        new_user.password_hash = generate_pass_hash(user_data_dict['password'])
+        new_user.password_hash = await password_hasher.hash(user_data_dict['password'])
         session.add(new_user)
         await session.commit()
-        return new_user
\ No newline at end of file
+        return new_user
+
+    async def rehash_password(self, user_id:uuid.UUID, password:str):
+        # runs as a background task after the login response, so it owns its session
+        new_hash = await password_hasher.hash(password)
+        async with async_session_maker() as session:
+            statement = update(User).where(User.id == user_id).values(password_hash=new_hash)
+            await session.exec(statement)
+            await session.commit()
+        invalidate_user(user_id)
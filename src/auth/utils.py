@@ -1,15 +1,37 @@
 from passlib.context import CryptContext
 from datetime import timedelta, datetime
 from src.config import Config
+from src.core.cache import TTLCache
+from typing import Optional, Sequence
+import hashlib
 import jwt
 import uuid
 import logging
-pass_context = CryptContext(
-    schemes=['bcrypt']
+import time
+
+def build_pass_context(scheme:str, rounds:int, deprecated_schemes:Sequence[str] = ())->CryptContext:
+    # min/max pin the cost so hashes made at any other cost report needs_update
+    return CryptContext(
+        schemes=[scheme, *deprecated_schemes],
+        deprecated="auto",
+        **{
+            f"{scheme}__default_rounds": rounds,
+            f"{scheme}__min_rounds": rounds,
+            f"{scheme}__max_rounds": rounds,
+        }
+    )
+
+pass_context = build_pass_context(
+    Config.PASSWORD_HASH_SCHEME,
+    Config.PASSWORD_HASH_ROUNDS,
+    Config.PASSWORD_HASH_DEPRECATED_SCHEMES
 )
 
 ACCESS_TOKEN_EXPIRY = 3600
 
+# verified payloads keyed by token digest, each entry expires with the token itself
+token_cache = TTLCache(maxsize=Config.TOKEN_CACHE_MAXSIZE, ttl=ACCESS_TOKEN_EXPIRY)
+
 def generate_pass_hash(password:str)->str:
     hash = pass_context.hash(password)
     return hash
@@ -17,8 +39,18 @@ def generate_pass_hash(password:str)->str:
 def verify_password(password:str, hash: str) -> bool:
     return pass_context.verify(password, hash)
 
+def password_needs_update(hash:str) -> bool:
+    return pass_context.needs_update(hash)
+
 
-def create_access_token(user_data:dict, expiry:timedelta = timedelta(ACCESS_TOKEN_EXPIRY), refresh:bool = False):
+def user_claims(user)->dict:
+    return {
+        'email': user.email,
+        'user_id': str(user.id),
+        'user_type': user.user_type.value
+    }
+
+def create_access_token(user_data:dict, expiry:timedelta = timedelta(seconds=ACCESS_TOKEN_EXPIRY), refresh:bool = False):
     payload = {}
     
     payload['user'] = user_data
@@ -34,7 +66,7 @@ def create_access_token(user_data:dict, expiry:timedelta = timedelta(ACCESS_TOKE
     
     return token
 
-def decode_token(token:str)->dict:
+def decode_token(token:str)->Optional[dict]:
     try:
         token_data = jwt.decode(
             jwt=token,
@@ -43,7 +75,16 @@ def decode_token(token:str)->dict:
         )
         return token_data
     except jwt.PyJWTError as e:
-        return {
-            "error" :logging.exception(e)
-            }
-        
\ No newline at end of file
+        logging.debug("rejected token: %s", e)
+        return None
+
+def verify_token(token:str)->Optional[dict]:
+    key = hashlib.sha256(token.encode()).digest()
+    token_data = token_cache.get(key)
+    if token_data is not None:
+        return token_data
+
+    token_data = decode_token(token)
+    if token_data is not None:
+        token_cache.set(key, token_data, ttl=token_data['exp'] - time.time())
+    return token_data
@@ -1,10 +1,52 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Optional
 class Settings(BaseSettings):
     DATABASE_URL: str = "postgres:///default.db"
+    DB_ECHO:bool = False
+    DB_POOL_SIZE:int = 5
+    DB_MAX_OVERFLOW:int = 10
+    DB_POOL_TIMEOUT:float = 30
+    DB_POOL_RECYCLE:int = 1800
+    DB_POOL_PRE_PING:bool = True
+    DB_PGBOUNCER:bool = False
+    DATABASE_REPLICA_URL:Optional[str] = None
+    REPLICA_STICKY_SECONDS:float = 5
+    REPLICA_STICKY_MAXSIZE:int = 100000
     JWT_SECRET:str = "secret"
     JWT_ALGORITHM:str = "H256"
     REDIS_HOST:str = "localhost"
     REDIS_PORT:int = 6379
+    REDIS_BACKEND:str = "redis"
+    REDIS_MAX_CONNECTIONS:int = 50
+    REDIS_SOCKET_TIMEOUT:float = 1.0
+    REDIS_SOCKET_CONNECT_TIMEOUT:float = 1.0
+    REDIS_HEALTH_CHECK_INTERVAL:int = 30
+    REDIS_SUBSCRIBE_POLL_INTERVAL:float = 1.0
+    REDIS_RECONNECT_DELAY:float = 1.0
+    BLOCKLIST_CACHE_MAXSIZE:int = 100000
+    BLOCKLIST_CLEAN_TTL:float = 300
+    BLOCKLIST_FAIL_OPEN:bool = False
+    USER_CACHE_MAXSIZE:int = 10000
+    USER_CACHE_TTL:float = 60
+    TOKEN_CACHE_MAXSIZE:int = 10000
+    PASSWORD_HASH_SCHEME:str = "bcrypt"
+    PASSWORD_HASH_ROUNDS:int = 12
+    PASSWORD_HASH_DEPRECATED_SCHEMES:list[str] = []
+    PASSWORD_HASH_EXECUTOR:str = "thread"
+    PASSWORD_HASH_WORKERS:int = 4
+    PASSWORD_HASH_MAX_CONCURRENCY:int = 4
+    COUNT_CACHE_MAXSIZE:int = 10000
+    COUNT_CACHE_TTL:float = 30
+    SUGGEST_CACHE_MAXSIZE:int = 10000
+    SUGGEST_CACHE_TTL:float = 30
+    SUGGEST_TIMEOUT_MS:int = 150
+    IMPORT_BATCH_SIZE:int = 1000
+    IMPORT_MAX_ROWS:int = 100000
+    IMPORT_MAX_ERRORS:int = 100
+    IMPORT_MAX_RECORD_BYTES:int = 65536
+    EXPORT_BATCH_SIZE:int = 500
+    BATCH_MAX_ITEMS:int = 100
+    BULK_DELETE_MAX_ITEMS:int = 1000
     model_config = SettingsConfigDict(
         env_file=".env",
         extra="ignore"
@@ -1,5 +1,13 @@
-from  typing import Generic, TypeVar, List
+from  typing import Any, Callable, Generic, Optional, Sequence, TypeVar, List
 from pydantic import BaseModel
+from fastapi import HTTPException, status
+from sqlalchemy import literal, tuple_
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import date, datetime
+import base64
+import binascii
+import json
+import uuid
 
 T = TypeVar('T')
 
@@ -7,4 +15,98 @@ class PaginatedResponse(BaseModel, Generic[T]) :
     data:List[T]
     page:int
     page_size:int
-    total:int
\ No newline at end of file
+    total:Optional[int] = None
+    has_more:Optional[bool] = None
+
+class CursorPaginatedResponse(BaseModel, Generic[T]) :
+    data:List[T]
+    page_size:int
+    next_cursor:Optional[str] = None
+
+
+DEFAULT_PAGE_SIZE = 10
+
+
+def child_list_page_size(page_size: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    """Page size for the timeline and interview lists.
+
+    Without page_size or cursor the full list is returned, as before. A
+    cursor on its own continues with the default page size.
+    """
+    if cursor is not None and page_size is None:
+        return DEFAULT_PAGE_SIZE
+    return page_size
+
+def _cursor_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_cursor_value(value) for value in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> list:
+    """Decode an opaque cursor back into values typed like the keyset columns."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(keys):
+            raise ValueError("cursor does not match the sort key")
+
+        values = []
+        for key, value in zip(keys, raw):
+            python_type = key.type.python_type
+            if python_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif python_type is date:
+                values.append(date.fromisoformat(value))
+            elif python_type is uuid.UUID:
+                values.append(uuid.UUID(value))
+            else:
+                values.append(python_type(value))
+        return values
+    except (ValueError, TypeError, binascii.Error, json.JSONDecodeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def apply_keyset(statement, keys: Sequence[Any], cursor: Optional[str], page_size: int):
+    """Order ``statement`` descending on ``keys`` and resume after ``cursor``.
+
+    One extra row is fetched so ``cursor_page`` can tell whether another page exists.
+    """
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        statement = statement.where(
+            tuple_(*keys) < tuple_(*[literal(value, key.type) for key, value in zip(keys, values)])
+        )
+    return statement.order_by(*[key.desc() for key in keys]).limit(page_size + 1)
+
+
+def cursor_page(rows: Sequence[Any], keys: Sequence[Any], page_size: int, key_values: Optional[Callable[[Any], Sequence[Any]]] = None) -> dict:
+    if key_values is None:
+        key_values = lambda row: [getattr(row, key.key) for key in keys]
+
+    has_more = len(rows) > page_size
+    rows = list(rows[:page_size])
+    return {
+        "data": rows,
+        "page_size": page_size,
+        "next_cursor": encode_cursor(key_values(rows[-1])) if has_more else None,
+    }
+
+
+async def estimate_count(session: AsyncSession, statement) -> int:
+    """Row estimate for ``statement`` from the planner's statistics, without running it."""
+    compiled = statement.compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True})  # type: ignore[union-attr]
+    # sent as driver SQL, text() would read ":name" inside a search literal as a bind parameter
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -1,27 +1,161 @@
 from sqlmodel import create_engine, SQLModel
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import exc
 from sqlmodel.ext.asyncio.session import AsyncSession
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
+from redis.exceptions import RedisError
+import logging
+import math
+import time
+import uuid
 
 from src.config import Config
+from src.core.cache import TTLCache
+from src.db.redis import get_redis
 
-async_engine = create_async_engine(
-    url=Config.DATABASE_URL,
-    echo=True
+
+class PoolWaitStats:
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def stats(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+def engine_connect_args(pgbouncer: Optional[bool] = None) -> dict:
+    if pgbouncer is None:
+        pgbouncer = Config.DB_PGBOUNCER
+    if not pgbouncer:
+        return {}
+    # a transaction-mode pooler hands each transaction to any server connection, so
+    # asyncpg must not reuse named prepared statements across them
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+
+
+def build_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url=url,
+        connect_args=engine_connect_args(),
+        echo=Config.DB_ECHO,
+        poolclass=InstrumentedQueuePool,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_timeout=Config.DB_POOL_TIMEOUT,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_pre_ping=Config.DB_POOL_PRE_PING,
+    )
+
+
+async_engine = build_engine(Config.DATABASE_URL)
+
+async_session_maker = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
 )
 
+# every transaction on the replica is opened READ ONLY
+replica_engine: Optional[AsyncEngine] = (
+    build_engine(Config.DATABASE_REPLICA_URL).execution_options(postgresql_readonly=True)
+    if Config.DATABASE_REPLICA_URL
+    else None
+)
+
+replica_session_maker = (
+    async_sessionmaker(bind=replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None
+    else None
+)
+
+# users who wrote recently read from the primary until the replica has caught up.
+# The pin lives in the shared store so every worker honours it, the local cache
+# only saves the lookup on the worker that handled the write
+PRIMARY_PIN_KEY = "primary-pin:{}"
+recent_writers = TTLCache(maxsize=Config.REPLICA_STICKY_MAXSIZE, ttl=Config.REPLICA_STICKY_SECONDS)
+
+
+async def mark_write(user_id: str) -> None:
+    recent_writers.set(user_id, True)
+    try:
+        await get_redis().set(PRIMARY_PIN_KEY.format(user_id), "", ex=math.ceil(Config.REPLICA_STICKY_SECONDS))
+    except RedisError as e:
+        logging.warning("could not pin %s to the primary: %s", user_id, e)
+
+
+async def is_pinned_to_primary(user_id: str) -> bool:
+    if recent_writers.get(user_id) is not None:
+        return True
+    try:
+        return await get_redis().get(PRIMARY_PIN_KEY.format(user_id)) is not None
+    except RedisError as e:
+        # without the shared pin a stale replica read is possible, the primary is always safe
+        logging.warning("primary pin lookup failed, reading from the primary: %s", e)
+        return True
+
 async def init_db()->None:
-    async with async_engine.begin() as conn:        
+    async with async_engine.begin() as conn:
         from src.db.models import JobApplication # type: ignore[unused-import]
         print(SQLModel.metadata.tables.keys())
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
 async def get_session()-> AsyncGenerator[AsyncSession, None]:
-    Session = async_sessionmaker(
-        bind=async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
-    async with Session() as session:
-        yield session
\ No newline at end of file
+    async with async_session_maker() as session:
+        yield session
+
+
+async def read_session_maker(user_id: Optional[str]) -> async_sessionmaker[AsyncSession]:
+    if replica_session_maker is None:
+        return async_session_maker
+    if user_id is not None and await is_pinned_to_primary(user_id):
+        return async_session_maker
+    return replica_session_maker
+
+
+def pool_stats(engine: AsyncEngine) -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),  # type: ignore[attr-defined]
+        "checked_in": pool.checkedin(),  # type: ignore[attr-defined]
+        "checked_out": pool.checkedout(),  # type: ignore[attr-defined]
+        "overflow": pool.overflow(),  # type: ignore[attr-defined]
+        "max_overflow": Config.DB_MAX_OVERFLOW,
+        "timeout": pool.timeout(),  # type: ignore[attr-defined]
+        **pool.wait_stats.stats(),  # type: ignore[attr-defined]
+    }
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Mapped
 from datetime import datetime, date
 from typing import Optional, List
 from src.auth.schemas import UserTypes
-from sqlalchemy import Enum as PgEnum
+from sqlalchemy import Enum as PgEnum, ForeignKey, Index, text
 from src.job_timeline.schemas import JobApplicationEvent
 from sqlalchemy.ext.hybrid import hybrid_property
 import uuid
@@ -14,6 +14,13 @@ import uuid
 class JobApplication(SQLModel, table=True) :
     model_config = {"arbitrary_types_allowed": True} # type: ignore[assignment]
     __tablename__ = "job_application" # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_job_application_user_status_created", "user_uid", "current_status", "created_at"),
+        Index("ix_job_application_live_user_created", "user_uid", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_job_application_live_created", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("idx_company_trgm", "company_name", postgresql_using="gin", postgresql_ops={"company_name": "gin_trgm_ops"}),
+        Index("idx_title_trgm", "job_title", postgresql_using="gin", postgresql_ops={"job_title": "gin_trgm_ops"}),
+    )
     id: uuid.UUID = Field(
         sa_column=Column(
           pg.UUID,
@@ -26,30 +33,23 @@ class JobApplication(SQLModel, table=True) :
     company_name:str = Field(index=True)
     location:str
     application_date:date = Field(index=True)
-    status:Optional["JobTimeline"] = Relationship(
-        back_populates="job_application",
-        sa_relationship_kwargs={
-            "order_by": "JobTimeline.created_at.desc()",
-            "uselist" : False,
-            "viewonly": True 
-        }
+    # status of the latest live timeline, kept in step by JobTimelineService
+    current_status: Optional[Status] = Field(
+        default=None,
+        sa_column=Column(pg.ENUM(Status, name="status", create_type=False), nullable=True)
     )
     user_uid:Optional[uuid.UUID] = Field(index=True,default=None, foreign_key="users.id")
     created_at:datetime =  Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
     updated_at:datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
     deleted_at: Optional[datetime] = Field(index=True, default=None)
-    user: Optional["User"] = Relationship(back_populates="job_applications")
-    job_interviews: List["JobInterview"] = Relationship(back_populates="job_application", sa_relationship_kwargs={"lazy":"selectin"})
+    # relationships never load implicitly, queries opt in with selectinload()
+    user: Optional["User"] = Relationship(back_populates="job_applications", sa_relationship_kwargs={"lazy": "raise"})
+    job_interviews: List["JobInterview"] = Relationship(back_populates="job_application", sa_relationship_kwargs={"lazy": "raise"})
     timelines: list["JobTimeline"] = Relationship(
         back_populates="job_application",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
 
-    @property
-    def current_status(self) -> Optional[Status]:
-        """Get current status from latest timeline"""
-        return self.status.status if self.status else None
-
     def __repr__(self) -> str:
         return f"<JobApplication {self.job_title}"
 
@@ -66,7 +66,7 @@ class User(SQLModel, table=True) :
     )
     username: str
     password_hash:str = Field(exclude=True)
-    email: str
+    email: str = Field(index=True)
     first_name:str
     last_name:str
     is_verified:bool = Field(default=False)
@@ -75,7 +75,7 @@ class User(SQLModel, table=True) :
     )
     created_at:datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
     updated_at:datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
-    job_applications: List["JobApplication"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy":"selectin"})
+    job_applications: List["JobApplication"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "raise"})
 
     
     def __repr__(self) -> str:
@@ -83,6 +83,9 @@ class User(SQLModel, table=True) :
 
 class JobInterview(SQLModel, table=True):
     __tablename__ = "job_interviews" # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_job_interviews_live_app_date", "job_application_id", "interview_date", "id", postgresql_where=text("deleted_at IS NULL")),
+    )
     id: uuid.UUID = Field(
         sa_column=Column(
           pg.UUID,
@@ -91,7 +94,7 @@ class JobInterview(SQLModel, table=True):
           default=uuid.uuid4  
         )
     )
-    job_application_id:Optional[uuid.UUID] = Field(default=None, foreign_key="job_application.id")
+    job_application_id:Optional[uuid.UUID] = Field(default=None, foreign_key="job_application.id", index=True)
     interview_type:JobInterviewType
     interview_date:date
     interviewer_name:str
@@ -100,7 +103,7 @@ class JobInterview(SQLModel, table=True):
     updated_at:datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
     deleted_at: Optional[datetime] = None
 
-    job_application: Optional["JobApplication"] = Relationship(back_populates="job_interviews")
+    job_application: Optional["JobApplication"] = Relationship(back_populates="job_interviews", sa_relationship_kwargs={"lazy": "raise"})
     
     def __repr__(self) -> str:
         return f"<JobInterview {self.interview_type}>"
@@ -109,6 +112,10 @@ class JobInterview(SQLModel, table=True):
 class JobTimeline(SQLModel, table=True):
     model_config = {"arbitary_types_allowed" :True} # type: ignore[assignment]
     __tablename__ = "job_timeline"# type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_job_timeline_live_app_event_date", "job_application_id", "event_date", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_job_timeline_live_app_created", "job_application_id", "created_at", postgresql_where=text("deleted_at IS NULL")),
+    )
     id: Optional[uuid.UUID] = Field(
         sa_column=Column(
           pg.UUID,
@@ -117,7 +124,7 @@ class JobTimeline(SQLModel, table=True):
           default=uuid.uuid4  
         )
     )
-    job_application_id:Optional[uuid.UUID] = Field(default=None, foreign_key="job_application.id")
+    job_application_id:Optional[uuid.UUID] = Field(default=None, foreign_key="job_application.id", index=True)
     event_type: JobApplicationEvent = Field(
        sa_column=Column(
            pg.ENUM(JobApplicationEvent, name="job_application_event"),
@@ -139,8 +146,24 @@ class JobTimeline(SQLModel, table=True):
     created_at:datetime =  Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
     updated_at:datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
     deleted_at: Optional[datetime] = Field(index=True, default=None)
-    job_application: Optional["JobApplication"] = Relationship(back_populates="timelines")
+    job_application: Optional["JobApplication"] = Relationship(back_populates="timelines", sa_relationship_kwargs={"lazy": "raise"})
 
     def __repr__(self) -> str:
         return f"<JobTimeline {self.event_type} on {self.event_date}>"
-    
+
+
+class JobApplicationSearch(SQLModel, table=True):
+    """Full-text document per application, written only by the triggers installed in migration 9c7d3e5f1a2b."""
+    __tablename__ = "job_application_search" # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_job_application_search_document", "document", postgresql_using="gin"),
+    )
+    job_application_id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID,
+            ForeignKey("job_application.id", ondelete="CASCADE"),
+            primary_key=True
+        )
+    )
+    document: Optional[str] = Field(default=None, sa_column=Column(pg.TSVECTOR, nullable=True))
+
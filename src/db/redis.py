@@ -1,22 +1,288 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import AsyncIterator, Optional
 import redis.asyncio as redis
+from redis.exceptions import RedisError
 from src.config import Config
+from src.core.cache import TTLCache
 
 JTI_EXPIRY = 3600
+REVOCATION_CHANNEL = "jti-revoked"
 
-token_blocklist = redis.StrictRedis(
-    host=Config.REDIS_HOST,
-    port=Config.REDIS_PORT,
-    db=0
+
+class RedisSubscription:
+    def __init__(self, client: redis.Redis, channel: str, poll_interval: float) -> None:
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self.channel = channel
+        self.poll_interval = poll_interval
+
+    async def __aenter__(self) -> "RedisSubscription":
+        await self._pubsub.subscribe(self.channel)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._pubsub.aclose()
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        # poll with a timeout instead of blocking so the idle connection never trips socket_timeout
+        while True:
+            message = await self._pubsub.get_message(timeout=self.poll_interval)
+            if message is not None:
+                yield message["data"]
+
+
+class RedisStore:
+    def __init__(self) -> None:
+        pool = redis.ConnectionPool(
+            host=Config.REDIS_HOST,
+            port=Config.REDIS_PORT,
+            db=0,
+            max_connections=Config.REDIS_MAX_CONNECTIONS,
+            socket_timeout=Config.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=Config.REDIS_SOCKET_CONNECT_TIMEOUT,
+            health_check_interval=Config.REDIS_HEALTH_CHECK_INTERVAL,
+            decode_responses=True,
+        )
+        self.pool = pool
+        self.client = redis.Redis.from_pool(pool)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
+        await self.client.set(key, value, ex=ex)
+
+    async def set_and_publish(self, key: str, value: str, channel: str, message: str, ex: Optional[int] = None) -> None:
+        # one round trip for both commands
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=ex)
+            pipe.publish(channel, message)
+            await pipe.execute()
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        return await self.client.delete(*keys)
+
+    async def publish(self, channel: str, message: str) -> int:
+        return await self.client.publish(channel, message)
+
+    def subscribe(self, channel: str) -> RedisSubscription:
+        return RedisSubscription(self.client, channel, Config.REDIS_SUBSCRIBE_POLL_INTERVAL)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "redis",
+            "max_connections": self.pool.max_connections,
+            "in_use": len(self.pool._in_use_connections),
+            "idle": len(self.pool._available_connections),
+        }
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class MemorySubscription:
+    def __init__(self, store: "MemoryStore", channel: str) -> None:
+        self._store = store
+        self.channel = channel
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+
+    async def __aenter__(self) -> "MemorySubscription":
+        self._store._subscribers[self.channel].add(self._queue)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._store._subscribers[self.channel].discard(self._queue)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        while True:
+            yield await self._queue.get()
+
+
+class MemoryStore:
+    """Process-local stand-in for RedisStore, for tests and benchmarks without a server."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[Optional[float], str]] = {}
+        self._subscribers: defaultdict[str, set[asyncio.Queue]] = defaultdict(set)
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ex if ex is not None else None
+        self._data[key] = (expires_at, value)
+
+    async def set_and_publish(self, key: str, value: str, channel: str, message: str, ex: Optional[int] = None) -> None:
+        await self.set(key, value, ex=ex)
+        await self.publish(channel, message)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+    async def publish(self, channel: str, message: str) -> int:
+        queues = self._subscribers[channel]
+        for queue in queues:
+            queue.put_nowait(message)
+        return len(queues)
+
+    def subscribe(self, channel: str) -> MemorySubscription:
+        return MemorySubscription(self, channel)
+
+    def stats(self) -> dict:
+        return {"backend": "memory", "keys": len(self._data)}
+
+    async def close(self) -> None:
+        self._data.clear()
+        self._subscribers.clear()
+
+
+_store: Optional[RedisStore | MemoryStore] = None
+
+
+def get_redis() -> RedisStore | MemoryStore:
+    global _store
+    if _store is None:
+        _store = MemoryStore() if Config.REDIS_BACKEND == "memory" else RedisStore()
+    return _store
+
+
+async def close_redis() -> None:
+    global _store
+    if _store is not None:
+        await _store.close()
+        _store = None
+
+
+class RevocationCache:
+    """Per-worker view of the Redis blocklist.
+
+    Revoked JTIs are remembered until the token expires. JTIs that Redis
+    reported as clean are only trusted while this worker is subscribed to
+    the revocation channel, since that is how it learns about logouts
+    handled by other workers.
+    """
+
+    def __init__(self, maxsize: int, clean_ttl: float) -> None:
+        self.revoked = TTLCache(maxsize=maxsize, ttl=JTI_EXPIRY)
+        self.clean = TTLCache(maxsize=maxsize, ttl=clean_ttl)
+        self.clean_ttl = clean_ttl
+        self.listening = False
+        # bumped on every revocation message so an in-flight GET cannot cache a stale "clean"
+        self.generation = 0
+
+    def lookup(self, jti: str) -> Optional[bool]:
+        if self.revoked.get(jti) is not None:
+            return True
+        if self.listening and self.clean.get(jti) is not None:
+            return False
+        return None
+
+    def mark_revoked(self, jti: str, ttl: float) -> None:
+        self.generation += 1
+        self.clean.pop(jti)
+        self.revoked.set(jti, True, ttl=ttl)
+
+    def mark_clean(self, jti: str, ttl: float, generation: int) -> None:
+        if self.listening and generation == self.generation:
+            self.clean.set(jti, True, ttl=min(ttl, self.clean_ttl))
+
+    def subscribed(self) -> None:
+        # anything published while we were not listening is lost, start over
+        self.generation += 1
+        self.clean.clear()
+        self.listening = True
+
+    def stats(self) -> dict:
+        return {
+            "listening": self.listening,
+            "revoked": self.revoked.stats(),
+            "clean": self.clean.stats(),
+        }
+
+
+revocation_cache = RevocationCache(
+    maxsize=Config.BLOCKLIST_CACHE_MAXSIZE,
+    clean_ttl=Config.BLOCKLIST_CLEAN_TTL
 )
+_revocation_listener: Optional[asyncio.Task] = None
+
+
+def remaining_lifetime(exp: Optional[float]) -> int:
+    if exp is None:
+        return JTI_EXPIRY
+    return max(int(exp - time.time()) + 1, 1)
+
+
+async def add_jti_to_blocklist(jti:str, exp:Optional[float] = None)->None:
+    ttl = remaining_lifetime(exp)
+    revocation_cache.mark_revoked(jti, ttl)
+    await get_redis().set_and_publish(jti, "", REVOCATION_CHANNEL, f"{jti}:{ttl}", ex=ttl)
+
+async def token_in_blocklist(jti:str, exp:Optional[float] = None)->bool:
+    cached = revocation_cache.lookup(jti)
+    if cached is not None:
+        return cached
+
+    generation = revocation_cache.generation
+    try:
+        revoked = await get_redis().get(jti) is not None
+    except RedisError as e:
+        # safe mode: keep honouring what this worker already knows, refuse the rest
+        logging.warning("blocklist unavailable, falling back to local cache: %s", e)
+        if revocation_cache.clean.get(jti) is not None:
+            return False
+        return not Config.BLOCKLIST_FAIL_OPEN
+
+    ttl = remaining_lifetime(exp)
+    if revoked:
+        revocation_cache.mark_revoked(jti, ttl)
+    else:
+        revocation_cache.mark_clean(jti, ttl, generation)
+    return revoked
+
+
+async def listen_for_revocations() -> None:
+    while True:
+        try:
+            async with get_redis().subscribe(REVOCATION_CHANNEL) as subscription:
+                revocation_cache.subscribed()
+                async for message in subscription:
+                    jti, _, ttl = message.rpartition(":")
+                    revocation_cache.mark_revoked(jti, int(ttl))
+        except RedisError as e:
+            logging.warning("revocation channel lost: %s", e)
+        except Exception:
+            # a bad message or socket error must not end the listener for good,
+            # CancelledError is not an Exception so shutdown still gets through
+            logging.exception("revocation listener failed, reconnecting")
+        finally:
+            revocation_cache.listening = False
+        await asyncio.sleep(Config.REDIS_RECONNECT_DELAY)
+
+
+def start_revocation_listener() -> None:
+    global _revocation_listener
+    if _revocation_listener is None:
+        _revocation_listener = asyncio.create_task(listen_for_revocations())
 
 
-async def add_jti_to_blocklist(jti:str)->None:
-    await token_blocklist.set(
-        name=jti,
-        value="",
-        ex=JTI_EXPIRY
-    )
-    
-async def token_in_blocklist(jti:str)->bool:
-    jti = await token_blocklist.get(jti)
-    return jti is not None
+async def stop_revocation_listener() -> None:
+    global _revocation_listener
+    if _revocation_listener is not None:
+        _revocation_listener.cancel()
+        try:
+            await _revocation_listener
+        except asyncio.CancelledError:
+            pass
+        _revocation_listener = None
@@ -1,11 +1,58 @@
 from fastapi import HTTPException, status
+from sqlalchemy import exists
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from ..db.models import JobApplication
 import uuid
 
-async def ensure_job_belongs_to_user(job_uid: str, user_id: uuid.UUID, session: AsyncSession) -> JobApplication:
-    statement = select(JobApplication).where(
+# session.info key for the (job, user) pairs already proven in this request's session
+OWNED_JOBS = "owned_job_applications"
+
+
+def _owned_jobs(session: AsyncSession) -> set:
+    return session.info.setdefault(OWNED_JOBS, set())
+
+
+def remember_ownership(job_uid, user_id: uuid.UUID, session: AsyncSession) -> None:
+    _owned_jobs(session).add((str(job_uid), user_id))
+
+
+def owned_job_filter(statement, model, job_uid, user_id: uuid.UUID, session: AsyncSession):
+    """Scope a child-table query to ``job_uid`` and fold the ownership test into it.
+
+    The EXISTS is dropped once this session has already proven ownership, so
+    each operation stays a single statement either way.
+    """
+    statement = statement.where(model.job_application_id == job_uid)
+    if (str(job_uid), user_id) in _owned_jobs(session):
+        return statement
+    return statement.where(
+        exists().where(
+            JobApplication.id == job_uid,
+            JobApplication.user_uid == user_id,
+            JobApplication.deleted_at == None,
+        )
+    )
+
+
+async def confirm_ownership(found: bool, job_uid, user_id: uuid.UUID, session: AsyncSession) -> None:
+    """Record ownership after an ``owned_job_filter`` query.
+
+    Rows coming back prove it. An empty result is either someone else's job
+    or simply no matching child, so only then is the application looked up
+    to keep the 403 for foreign jobs.
+    """
+    if found:
+        remember_ownership(job_uid, user_id, session)
+    else:
+        await ensure_job_belongs_to_user(str(job_uid), user_id, session)
+
+
+async def ensure_job_belongs_to_user(job_uid: str, user_id: uuid.UUID, session: AsyncSession) -> None:
+    if (str(job_uid), user_id) in _owned_jobs(session):
+        return
+
+    statement = select(JobApplication.id).where(
         JobApplication.id == job_uid,
         JobApplication.user_uid == user_id,
         JobApplication.deleted_at == None
@@ -19,4 +66,28 @@ async def ensure_job_belongs_to_user(job_uid: str, user_id: uuid.UUID, session:
             detail="Not authorized to access this job application"
         )
 
-    return job_app
+    remember_ownership(job_uid, user_id, session)
+
+
+async def lock_owned_job(job_uid: str, user_id: uuid.UUID, session: AsyncSession) -> None:
+    """Prove ownership and hold the application's row lock until commit.
+
+    Writes that pick a timeline row by position (undo, reset) take this first,
+    so they run one at a time per application and each sees the previous
+    one's result. It has to be its own statement: under READ COMMITTED the
+    next statement then starts with a snapshot taken after the lock was won.
+    """
+    statement = select(JobApplication.id).where(
+        JobApplication.id == job_uid,
+        JobApplication.user_uid == user_id,
+        JobApplication.deleted_at == None
+    ).with_for_update()
+    result = await session.exec(statement)
+
+    if not result.first():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this job application"
+        )
+
+    remember_ownership(job_uid, user_id, session)
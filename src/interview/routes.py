@@ -1,41 +1,49 @@
-from typing import Annotated
-from fastapi import APIRouter, status, Depends
+from typing import Annotated, Optional
+from fastapi import APIRouter, status, Depends, Body, Query
 from fastapi.exceptions import HTTPException
 from src.db.main import get_session
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.auth.dependencies import (
-    AccessTokenBearer,
     RoleChecker,
+    access_token_bearer,
     get_current_user,
     get_interview_service,
+    get_read_session,
 )
 from .service import JobInterviewService
 from src.db.models import JobInterview, User
+from src.core.pagination import CursorPaginatedResponse, child_list_page_size
+from src.config import Config
 from .schemas import JobInterviewCreateModel, JobInterviewUpdateModel
 import uuid
 
-access_token_bearer = AccessTokenBearer()
 job_interview_router = APIRouter(
     prefix="/job-applications/{job_application_id}/interviews", tags=["Job Interviews"]
 )
 JobInterviewServices = Annotated[JobInterviewService, Depends(get_interview_service)]
 SessionDependency = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDependency = Annotated[AsyncSession, Depends(get_read_session)]
 UserDependency = Annotated[User, Depends(get_current_user)]
-role_checker_standard = Depends(RoleChecker(["ADMIN", "USER", "GUEST"]))
-role_checker_admin = Depends(RoleChecker(["ADMIN"]))
+role_checker_standard = Depends(RoleChecker(["ADMIN", "USER", "GUEST"], claims_only=True))
+role_checker_admin = Depends(RoleChecker(["ADMIN"], claims_only=True))
 
 
 @job_interview_router.get(
-    "/", response_model=list[JobInterview], dependencies=[role_checker_standard]
+    "/",
+    response_model=list[JobInterview] | CursorPaginatedResponse[JobInterview],
+    dependencies=[role_checker_standard],
 )
 async def get_all_job_interviews(
     job_application_id: str,
     job_interview_service: JobInterviewServices,
-    session: SessionDependency,
+    session: ReadSessionDependency,
     current_user: UserDependency,
+    page_size: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
 ):
+    page_size = child_list_page_size(page_size, cursor)
     job_interviews = await job_interview_service.get_all_interviews_by_app_id(
-        job_application_id, current_user.id, session
+        job_application_id, current_user.id, session, page_size, cursor
     )
     return job_interviews
 
@@ -49,10 +57,10 @@ async def get_job_interview_by_id(
     job_application_id: str,
     job_interview_id: str,
     job_interview_service: JobInterviewServices,
-    session: SessionDependency,
+    session: ReadSessionDependency,
     current_user: UserDependency,
 ):
-    job_interview = job_interview_service.get_interviews_by_id(
+    job_interview = await job_interview_service.get_interviews_by_id(
         job_application_id, job_interview_id, current_user.id, session
     )
     if job_interview is not None:
@@ -83,6 +91,28 @@ async def create_job_application(
     return job_interview
 
 
+@job_interview_router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=list[JobInterview],
+    response_model_exclude_none=True,
+    dependencies=[role_checker_standard],
+)
+async def create_job_interviews(
+    job_application_id: uuid.UUID,
+    job_interview_service: JobInterviewServices,
+    session: SessionDependency,
+    current_user: UserDependency,
+    interviews_data: list[JobInterviewCreateModel] = Body(
+        ..., min_length=1, max_length=Config.BATCH_MAX_ITEMS
+    ),
+):
+    job_interviews = await job_interview_service.create_job_interviews(
+        interviews_data, job_application_id, current_user.id, session
+    )
+    return job_interviews
+
+
 @job_interview_router.patch(
     "/{interview_id}",
     response_model_exclude_none=True,
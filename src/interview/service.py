@@ -1,22 +1,34 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select, desc
+from sqlmodel import select, desc, insert
 from .schemas import JobInterviewCreateModel, JobInterviewUpdateModel
 from ..db.models import JobInterview
 from datetime import datetime
-from src.helper.ownership import ensure_job_belongs_to_user
+from src.helper.ownership import confirm_ownership, ensure_job_belongs_to_user, owned_job_filter
+from src.core.pagination import apply_keyset, cursor_page
+from typing import Optional
 import uuid
+
+INTERVIEW_KEYSET = (JobInterview.interview_date, JobInterview.id)
+
 class JobInterviewService:
-    async def get_all_interviews_by_app_id(self, job_application_id:str, user_id:uuid.UUID, session: AsyncSession):
-        await ensure_job_belongs_to_user(job_application_id, user_id, session)
-        statement = select(JobInterview).where(JobInterview.job_application_id == job_application_id, JobInterview.deleted_at == None).order_by(desc(JobInterview.interview_date))
-        result = await session.exec(statement)
-        return result.all()
+    async def get_all_interviews_by_app_id(self, job_application_id:str, user_id:uuid.UUID, session: AsyncSession, page_size:Optional[int] = None, cursor:Optional[str] = None):
+        statement = owned_job_filter(select(JobInterview).where(JobInterview.deleted_at == None), JobInterview, job_application_id, user_id, session)
+        if page_size is not None:
+            result = await session.exec(apply_keyset(statement, INTERVIEW_KEYSET, cursor, page_size))
+            rows = result.all()
+            await confirm_ownership(bool(rows), job_application_id, user_id, session)
+            return cursor_page(rows, INTERVIEW_KEYSET, page_size)
+
+        result = await session.exec(statement.order_by(desc(JobInterview.interview_date)))
+        job_interviews = result.all()
+        await confirm_ownership(bool(job_interviews), job_application_id, user_id, session)
+        return job_interviews
 
     async def get_interviews_by_id(self, job_application_id:str,job_interview_id:str, user_id:uuid.UUID,session:AsyncSession):
-        await ensure_job_belongs_to_user(job_application_id, user_id, session)
-        statement = select(JobInterview).where(JobInterview.job_application_id == job_application_id, JobInterview.id == job_interview_id, JobInterview.deleted_at == None)
+        statement = owned_job_filter(select(JobInterview).where(JobInterview.id == job_interview_id, JobInterview.deleted_at == None), JobInterview, job_application_id, user_id, session)
         result = await session.exec(statement)
         job_interview = result.first()
+        await confirm_ownership(job_interview is not None, job_application_id, user_id, session)
         return job_interview if job_interview is not None else None
     
     async def create_job_interview(self, interview_data:JobInterviewCreateModel, job_application_id:uuid.UUID, user_id:uuid.UUID, session:AsyncSession):
@@ -31,6 +43,27 @@ class JobInterviewService:
         session.add(new_data)
         await session.commit()
         return new_data
+
+    async def create_job_interviews(self, interviews_data:list[JobInterviewCreateModel], job_application_id:uuid.UUID, user_id:uuid.UUID, session:AsyncSession):
+        # one ownership check, one multi-row INSERT ... RETURNING, one commit
+        await ensure_job_belongs_to_user(str(job_application_id), user_id, session)
+        now = datetime.now()
+        rows = [
+            {
+                **interview_data.model_dump(),
+                "id": uuid.uuid4(),
+                "job_application_id": job_application_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for interview_data in interviews_data
+        ]
+
+        statement = insert(JobInterview).values(rows).returning(JobInterview)
+        result = await session.exec(statement)  # type: ignore[call-overload]
+        new_interviews = result.scalars().all()
+        await session.commit()
+        return new_interviews
     
     async def update_job_interview(self, job_application_id:str, job_interview_id:str, user_id:uuid.UUID,update_data:JobInterviewUpdateModel,session: AsyncSession):
         job_interview_to_update = await self.get_interviews_by_id(job_application_id,job_interview_id, user_id,session)
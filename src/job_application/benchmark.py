@@ -0,0 +1,99 @@
+"""Compare the old two-transaction create_job path with the current one.
+
+    python -m src.job_application.benchmark --user-id <uuid> --runs 500
+
+Creates ``--runs`` applications through each path against the configured
+database and prints creates per second and statements per create. Every
+row it creates is hard-deleted afterwards.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import date, datetime
+from sqlalchemy import delete, event
+from src.db.main import async_engine, async_session_maker
+from src.db.models import JobApplication, JobTimeline
+from src.job_timeline.schemas import EVENT_TO_STATUS, JobApplicationEvent, JobTimelineCreateModel
+from src.job_timeline.services import JobTimelineService
+from .schemas import JobApplicationCreateModel
+from .services import JobApplicationService
+
+
+async def legacy_create_job(service: JobApplicationService, job_data: JobApplicationCreateModel, user_uid: uuid.UUID, session):
+    # create_job as it was: flush, then create_job_timeline re-checks ownership and commits, then commit again
+    new_data = JobApplication(**job_data.model_dump())
+    new_data.user_uid = user_uid
+    session.add(new_data)
+    await session.flush()
+    await service.timeline_service.create_job_timeline(
+        JobTimelineCreateModel(
+            event_type=JobApplicationEvent.SAVED,
+            status=EVENT_TO_STATUS[JobApplicationEvent.SAVED],
+            event_date=datetime.combine(new_data.application_date, datetime.min.time()),
+            notes="",
+        ),
+        job_application_id=new_data.id,
+        user_id=new_data.user_uid,
+        session=session,
+    )
+    await session.commit()
+    return new_data
+
+
+async def measure(create, user_id: uuid.UUID, runs: int, statements: list[int]) -> tuple[float, float, list[uuid.UUID]]:
+    job_data = JobApplicationCreateModel(
+        job_title="Benchmark Engineer",
+        company_name="Benchmark Inc",
+        location="Remote",
+        application_date=date.today(),
+    )
+    created = []
+    statements[0] = 0
+    start = time.perf_counter()
+    for _ in range(runs):
+        async with async_session_maker() as session:
+            job = await create(job_data, user_id, session)
+            created.append(job.id)
+    elapsed = time.perf_counter() - start
+    return runs / elapsed, statements[0] / runs, created
+
+
+async def benchmark(user_id: uuid.UUID, runs: int) -> None:
+    service = JobApplicationService(JobTimelineService())
+    statements = [0]
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements[0] += 1
+
+    paths = {
+        "legacy": lambda job_data, user_uid, session: legacy_create_job(service, job_data, user_uid, session),
+        "current": service.create_job,
+    }
+    created: list[uuid.UUID] = []
+    try:
+        print(f"{'path':<8} {'creates/s':>10} {'stmts/create':>13}")
+        for name, create in paths.items():
+            rate, per_create, ids = await measure(create, user_id, runs, statements)
+            created += ids
+            print(f"{name:<8} {rate:>10.1f} {per_create:>13.1f}")
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", _count)
+        async with async_session_maker() as session:
+            await session.exec(delete(JobTimeline).where(JobTimeline.job_application_id.in_(created)))  # type: ignore[call-overload, union-attr]
+            await session.exec(delete(JobApplication).where(JobApplication.id.in_(created)))  # type: ignore[call-overload, attr-defined]
+            await session.commit()
+        await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=uuid.UUID, required=True)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.user_id, args.runs))
+
+
+if __name__ == "__main__":
+    main()
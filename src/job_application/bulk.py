@@ -0,0 +1,199 @@
+"""Streaming CSV / NDJSON import of job applications.
+
+Rows are parsed and validated as the request body arrives, valid rows are
+COPYed in batches into temporary staging tables, and one INSERT ... SELECT
+per table moves them into place when the body is exhausted, so the whole
+import commits or fails as a unit.
+"""
+import codecs
+import csv
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Literal
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.config import Config
+from src.job_timeline.schemas import EVENT_TO_STATUS, JobApplicationEvent
+from .schemas import JobApplicationCreateModel
+
+ImportFormat = Literal["csv", "ndjson"]
+
+IMPORT_CONTENT_TYPES: dict[str, ImportFormat] = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+APPLICATION_COLUMNS = ("id", "job_title", "company_name", "location", "application_date", "current_status", "user_uid", "created_at", "updated_at")
+TIMELINE_COLUMNS = ("id", "job_application_id", "event_type", "status", "event_date", "notes", "created_at", "updated_at")
+
+# csv.reader(strict=True) raises this when the input stops inside a quoted field
+CSV_INCOMPLETE_RECORD = "unexpected end of data"
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    try:
+        async for chunk in chunks:
+            buffer += decoder.decode(chunk)
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                yield line + "\n"
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Import must be UTF-8 encoded")
+    if buffer:
+        yield buffer
+
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, Any]]:
+    header = None
+    pending: list[str] = []
+    pending_size = 0
+    row_number = 0
+    async for line in lines:
+        pending.append(line)
+        pending_size += len(line)
+        try:
+            records = list(csv.reader(pending, strict=True))
+        except csv.Error as e:
+            if str(e) == CSV_INCOMPLETE_RECORD and pending_size <= Config.IMPORT_MAX_RECORD_BYTES:
+                # a quoted field continues on the next line
+                continue
+            pending, pending_size = [], 0
+            if header is not None:
+                row_number += 1
+                yield row_number, ValueError("unterminated quoted field" if str(e) == CSV_INCOMPLETE_RECORD else f"malformed CSV: {e}")
+            continue
+
+        pending, pending_size = [], 0
+        for values in records:
+            if not values:
+                continue
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            row_number += 1
+            yield row_number, dict(zip(header, values))
+
+    if pending:
+        yield row_number + 1, ValueError("unterminated quoted field")
+
+
+async def iter_ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, Any]]:
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            yield row_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, ValueError(f"invalid JSON: {e.msg}")
+
+
+def row_errors(error: Exception) -> list[str]:
+    if isinstance(error, ValidationError):
+        return [f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}" for item in error.errors()]
+    return [str(error)]
+
+
+class StagingLoader:
+    """COPYs validated rows into per-transaction staging tables shaped like the targets."""
+
+    def __init__(self, session: AsyncSession, user_id: uuid.UUID) -> None:
+        self.session = session
+        self.user_id = user_id
+        self.driver_connection: Any = None
+
+    async def open(self) -> None:
+        # creating the tables also begins the transaction COPY has to run in
+        await self.session.exec(text(  # type: ignore[call-overload]
+            f"CREATE TEMP TABLE import_job_application ON COMMIT DROP AS "
+            f"SELECT {', '.join(APPLICATION_COLUMNS)} FROM job_application WITH NO DATA"
+        ))
+        await self.session.exec(text(  # type: ignore[call-overload]
+            f"CREATE TEMP TABLE import_job_timeline ON COMMIT DROP AS "
+            f"SELECT {', '.join(TIMELINE_COLUMNS)} FROM job_timeline WITH NO DATA"
+        ))
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        self.driver_connection = raw_connection.driver_connection
+
+    async def copy(self, jobs: list[JobApplicationCreateModel]) -> None:
+        now = datetime.now()
+        saved = EVENT_TO_STATUS[JobApplicationEvent.SAVED]
+        applications = []
+        timelines = []
+        for job in jobs:
+            job_id = uuid.uuid4()
+            application_date = job.application_date.date()
+            applications.append((job_id, job.job_title, job.company_name, job.location, application_date, saved.name, self.user_id, now, now))
+            timelines.append((uuid.uuid4(), job_id, JobApplicationEvent.SAVED.name, saved.name, application_date, "", now, now))
+
+        await self.driver_connection.copy_records_to_table("import_job_application", records=applications, columns=APPLICATION_COLUMNS)
+        await self.driver_connection.copy_records_to_table("import_job_timeline", records=timelines, columns=TIMELINE_COLUMNS)
+
+    async def finish(self) -> int:
+        application_columns = ", ".join(APPLICATION_COLUMNS)
+        timeline_columns = ", ".join(TIMELINE_COLUMNS)
+        result = await self.session.exec(text(  # type: ignore[call-overload]
+            f"INSERT INTO job_application ({application_columns}) SELECT {application_columns} FROM import_job_application"
+        ))
+        await self.session.exec(text(  # type: ignore[call-overload]
+            f"INSERT INTO job_timeline ({timeline_columns}) SELECT {timeline_columns} FROM import_job_timeline"
+        ))
+        return result.rowcount
+
+
+async def import_job_applications(chunks: AsyncIterator[bytes], fmt: ImportFormat, user_id: uuid.UUID, session: AsyncSession) -> dict:
+    started = time.perf_counter()
+    lines = iter_lines(chunks)
+    rows = iter_csv_rows(lines) if fmt == "csv" else iter_ndjson_rows(lines)
+
+    loader = StagingLoader(session, user_id)
+    await loader.open()
+
+    batch: list[JobApplicationCreateModel] = []
+    errors = []
+    valid = 0
+    failed = 0
+    async for row_number, value in rows:
+        if valid + failed >= Config.IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Imports are limited to {Config.IMPORT_MAX_ROWS} rows"
+            )
+        try:
+            if isinstance(value, Exception):
+                raise value
+            batch.append(JobApplicationCreateModel.model_validate(value))
+        except ValueError as e:
+            failed += 1
+            if len(errors) < Config.IMPORT_MAX_ERRORS:
+                errors.append({"row": row_number, "errors": row_errors(e)})
+            continue
+        valid += 1
+
+        if len(batch) >= Config.IMPORT_BATCH_SIZE:
+            await loader.copy(batch)
+            batch = []
+
+    if batch:
+        await loader.copy(batch)
+    imported = await loader.finish()
+    await session.commit()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round((imported + failed) / elapsed, 1) if elapsed else None,
+    }
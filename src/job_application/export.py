@@ -0,0 +1,108 @@
+"""Streaming NDJSON / CSV export of job applications.
+
+Applications are read through a server-side cursor one partition at a
+time; each partition's timelines and interviews are fetched with one
+query per child table, encoded, yielded and dropped, so memory stays flat
+however many rows are exported.
+"""
+import csv
+import io
+import json
+import uuid
+from typing import AsyncIterator, Literal, Optional, Sequence
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.config import Config
+from src.db.main import read_session_maker
+from ..db.models import JobApplication, JobInterview, JobTimeline
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+APPLICATION_COLUMNS = (
+    JobApplication.id, JobApplication.job_title, JobApplication.company_name, JobApplication.location,
+    JobApplication.application_date, JobApplication.current_status, JobApplication.created_at, JobApplication.updated_at,
+)
+TIMELINE_COLUMNS = (
+    JobTimeline.job_application_id, JobTimeline.id, JobTimeline.event_type, JobTimeline.status,
+    JobTimeline.event_date, JobTimeline.notes, JobTimeline.created_at,
+)
+INTERVIEW_COLUMNS = (
+    JobInterview.job_application_id, JobInterview.id, JobInterview.interview_type, JobInterview.interview_date,
+    JobInterview.interviewer_name, JobInterview.notes, JobInterview.created_at,
+)
+
+
+async def _children(session: AsyncSession, model, columns: Sequence, ids: list[uuid.UUID]) -> dict[uuid.UUID, list[dict]]:
+    statement = select(*columns).where(
+        model.job_application_id.in_(ids),
+        model.deleted_at == None
+    ).order_by(model.job_application_id, model.created_at)
+    result = await session.exec(statement)
+
+    children: dict[uuid.UUID, list[dict]] = {}
+    for row in result.all():
+        child = dict(row._mapping)
+        children.setdefault(child.pop("job_application_id"), []).append(jsonable_encoder(child))
+    return children
+
+
+def _encode(rows: list[dict], fmt: ExportFormat, header: Sequence[str]) -> str:
+    if fmt == "ndjson":
+        return "".join(json.dumps(row) + "\n" for row in rows)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            json.dumps(row[name]) if isinstance(row[name], list) else row[name]
+            for name in header
+        ])
+    return buffer.getvalue()
+
+
+async def stream_job_applications(request: Request, fmt: ExportFormat, user_id: Optional[uuid.UUID] = None) -> AsyncIterator[str]:
+    """Yield encoded applications of ``user_id``, or of every user when it is None."""
+    columns = APPLICATION_COLUMNS if user_id is not None else (*APPLICATION_COLUMNS, JobApplication.user_uid)
+    header = [column.key for column in columns] + ["timelines", "interviews"]
+
+    statement = select(*columns).where(JobApplication.deleted_at == None)
+    if user_id is not None:
+        statement = statement.where(JobApplication.user_uid == user_id)
+    statement = statement.order_by(JobApplication.created_at, JobApplication.id).execution_options(yield_per=Config.EXPORT_BATCH_SIZE)
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(header)
+        yield buffer.getvalue()
+
+    # the response outlives the request's dependencies, so the stream owns its session
+    session_maker = await read_session_maker(str(user_id) if user_id is not None else None)
+    async with session_maker() as session:
+        result = await session.stream(statement)
+        try:
+            async for partition in result.partitions():
+                if await request.is_disconnected():
+                    break
+
+                rows = [dict(row._mapping) for row in partition]
+                ids = [row["id"] for row in rows]
+                timelines = await _children(session, JobTimeline, TIMELINE_COLUMNS, ids)
+                interviews = await _children(session, JobInterview, INTERVIEW_COLUMNS, ids)
+
+                encoded = []
+                for row in rows:
+                    job_id = row["id"]
+                    row = jsonable_encoder(row)
+                    row["timelines"] = timelines.get(job_id, [])
+                    row["interviews"] = interviews.get(job_id, [])
+                    encoded.append(row)
+                yield _encode(encoded, fmt, header)
+        finally:
+            await result.close()
@@ -1,54 +1,90 @@
-from fastapi import APIRouter, status, Depends, Query
-from src.job_application.schemas import JobApplicationUpdateModel, JobApplicationCreateModel, JobApplicationDetail, JobApplication
+from fastapi import APIRouter, Body, Request, status, Depends, Query
+from src.job_application.schemas import BulkDeleteReport, BulkImportReport, JobApplicationUpdateModel, JobApplicationCreateModel, JobApplicationDetail, JobApplication
+from src.job_application.bulk import IMPORT_CONTENT_TYPES, ImportFormat
+from src.job_application.export import EXPORT_MEDIA_TYPES, ExportFormat
+from fastapi.responses import StreamingResponse
 from fastapi.exceptions import HTTPException
 from src.db.main import get_session
 from src.db.models import User, JobApplication as JobApplicationModel
 from sqlmodel.ext.asyncio.session import AsyncSession
-from src.job_application.services import JobApplicationService
-from src.auth.dependencies import AccessTokenBearer, RoleChecker, get_current_user, get_job_service
-from src.core.pagination import PaginatedResponse
-from typing import Optional
+from src.job_application.services import CountMode, JobApplicationService
+from src.job_application.enums import Status
+from src.auth.dependencies import RoleChecker, access_token_bearer, get_current_user, get_job_service, get_read_session
+from src.core.pagination import CursorPaginatedResponse, PaginatedResponse
+from src.config import Config
+from typing import Literal, Optional
 import uuid
 
-access_token_bearer = AccessTokenBearer()
 job_application_router =  APIRouter()
-role_checker_standard = Depends(RoleChecker(['ADMIN', 'USER', 'GUEST']))
-role_checker_admin = Depends(RoleChecker(['ADMIN']))
+role_checker_standard = Depends(RoleChecker(['ADMIN', 'USER', 'GUEST'], claims_only=True))
+role_checker_admin = Depends(RoleChecker(['ADMIN'], claims_only=True))
 
 @job_application_router.get(
     "/", 
-    response_model=PaginatedResponse[JobApplication],
+    response_model=PaginatedResponse[JobApplication] | CursorPaginatedResponse[JobApplication],
     dependencies=[role_checker_admin]
     )
 async def get_all_jobs(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, le=100),
     search: Optional[str] = None,
-    status: Optional[str] = None,
-    session:AsyncSession = Depends(get_session), 
+    status: Optional[Status] = None,
+    pagination: Literal["offset", "cursor"] = "offset",
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
+    session:AsyncSession = Depends(get_read_session), 
     token_details:dict=Depends(access_token_bearer),
     job_application_service:JobApplicationService=Depends(get_job_service),
     ):
-    job_applications = await job_application_service.get_all_jobs(session,page,page_size,search,status)
+    keyset = pagination == "cursor" or cursor is not None
+    job_applications = await job_application_service.get_all_jobs(session,page,page_size,search,status,cursor,keyset,count)
     return job_applications
 
-@job_application_router.get("/user", response_model=PaginatedResponse[JobApplication], dependencies=[role_checker_standard])
+@job_application_router.get("/user", response_model=PaginatedResponse[JobApplication] | CursorPaginatedResponse[JobApplication], dependencies=[role_checker_standard])
 async def get_jobs_by_user_id(
     page: int = Query(1, ge=1), 
     page_size: int = Query(10, le=100),
     search: Optional[str] = None,
-    status: Optional[str] = None,
-    session:AsyncSession = Depends(get_session), 
+    status: Optional[Status] = None,
+    pagination: Literal["offset", "cursor"] = "offset",
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
+    session:AsyncSession = Depends(get_read_session), 
     current_user: User = Depends(get_current_user),
     job_application_service:JobApplicationService=Depends(get_job_service)
     ):
-    job_applications = await job_application_service.get_user_jobs(current_user.id,session,page,page_size,search,status)
+    keyset = pagination == "cursor" or cursor is not None
+    job_applications = await job_application_service.get_user_jobs(current_user.id,session,page,page_size,search,status,cursor,keyset,count)
     return job_applications
 
+def export_response(stream, fmt: ExportFormat) -> StreamingResponse:
+    return StreamingResponse(
+        stream,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="job_applications.{fmt}"'}
+    )
+
+@job_application_router.get("/export", dependencies=[role_checker_standard])
+async def export_user_job_applications(
+    request: Request,
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    current_user: User = Depends(get_current_user),
+    job_application_service:JobApplicationService=Depends(get_job_service)
+    ):
+    return export_response(job_application_service.export_jobs(request, fmt, current_user.id), fmt)
+
+@job_application_router.get("/export/all", dependencies=[role_checker_admin])
+async def export_all_job_applications(
+    request: Request,
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    job_application_service:JobApplicationService=Depends(get_job_service)
+    ):
+    return export_response(job_application_service.export_jobs(request, fmt), fmt)
+
 @job_application_router.get("/{id}", response_model=JobApplicationDetail, dependencies=[role_checker_standard])
 async def get_job_by_id(
     id:str, 
-    session:AsyncSession = Depends(get_session), 
+    session:AsyncSession = Depends(get_read_session), 
     current_user: User = Depends(get_current_user),
     job_application_service:JobApplicationService=Depends(get_job_service)
     ):
@@ -71,6 +107,24 @@ async def create_job_application(
     job_application = await job_application_service.create_job(job_data,current_user.id, session)
     return job_application
 
+@job_application_router.post("/import", response_model=BulkImportReport, dependencies=[role_checker_standard])
+async def import_job_applications(
+    request: Request,
+    fmt: Optional[ImportFormat] = Query(None, alias="format"),
+    session:AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+    job_application_service:JobApplicationService=Depends(get_job_service)
+    ):
+    """Import applications from a CSV or NDJSON request body, one SAVED timeline each."""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    fmt = fmt or IMPORT_CONTENT_TYPES.get(content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson"
+        )
+    return await job_application_service.import_jobs(request.stream(), fmt, current_user.id, session)
+
 @job_application_router.patch("/{id}", response_model_exclude_none=True, dependencies=[role_checker_standard])
 async def update_job_application(
     id : str,job_data:JobApplicationUpdateModel,
@@ -88,6 +142,26 @@ async def update_job_application(
             detail="Job not found"
         )
     
+@job_application_router.post("/delete", response_model=BulkDeleteReport, dependencies=[role_checker_standard])
+async def delete_job_applications(
+    job_uids:list[uuid.UUID] = Body(..., min_length=1, max_length=Config.BULK_DELETE_MAX_ITEMS),
+    session:AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+    job_application_service:JobApplicationService=Depends(get_job_service)
+    ) :
+    """Soft-delete the listed applications, ids that are not yours or already deleted are skipped."""
+    deleted = await job_application_service.delete_jobs(current_user.id, session, job_uids)
+    return BulkDeleteReport(deleted=deleted)
+
+@job_application_router.delete("/user", response_model=BulkDeleteReport, dependencies=[role_checker_standard])
+async def delete_user_job_applications(
+    session:AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+    job_application_service:JobApplicationService=Depends(get_job_service)
+    ) :
+    deleted = await job_application_service.delete_jobs(current_user.id, session)
+    return BulkDeleteReport(deleted=deleted)
+
 @job_application_router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[role_checker_standard])
 async def delete_job_application(
     id:str,session:AsyncSession = Depends(get_session), 
@@ -39,4 +39,18 @@ class JobApplicationDetail(BaseModel):
     current_status : Optional[Status] = None
     timelines: Optional[List[JobTimeline]] = []
     job_interviews: Optional[List[JobInterview]] = []
-    
\ No newline at end of file
+
+
+class BulkImportRowError(BaseModel):
+    row:int
+    errors:List[str]
+
+class BulkImportReport(BaseModel):
+    imported:int
+    failed:int
+    errors:List[BulkImportRowError]
+    elapsed_seconds:float
+    rows_per_second:Optional[float] = None
+
+class BulkDeleteReport(BaseModel):
+    deleted:List[uuid.UUID]
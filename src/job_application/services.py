@@ -1,146 +1,156 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
+from fastapi import Request
 from .schemas import JobApplicationCreateModel, JobApplicationUpdateModel
 from ..db.models import JobApplication, JobInterview, JobTimeline
-from sqlmodel import select, desc
+from sqlmodel import select, desc, update
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Literal, Optional
 from sqlalchemy import or_, func
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import selectinload
 from sqlalchemy.sql.operators import ilike_op
-from src.job_timeline.schemas import EVENT_TO_STATUS, JobTimelineCreateModel, JobApplicationEvent
+from src.job_timeline.schemas import EVENT_TO_STATUS, JobApplicationEvent
 from src.job_application.enums import Status
 from src.job_timeline.services import JobTimelineService
+from src.core.pagination import apply_keyset, cursor_page, estimate_count
+from src.core.cache import TTLCache
+from .bulk import ImportFormat, import_job_applications
+from .export import ExportFormat, stream_job_applications
+from src.config import Config
 import uuid
 
 STATUS_ORDER = ["saved", "applied", "interviewed", "offer", "accepted", "rejected"]
+JOB_KEYSET = (JobApplication.created_at, JobApplication.id)
+
+CountMode = Literal["exact", "estimated", "none"]
+NO_STATUS = "none"
+
+# exact totals keyed by (user, normalized search, status), they lag writes by at most the TTL
+count_cache = TTLCache(maxsize=Config.COUNT_CACHE_MAXSIZE, ttl=Config.COUNT_CACHE_TTL)
 
 class JobApplicationService:
 
     def __init__(self, timeline_service: JobTimelineService):
         self.timeline_service = timeline_service
     
-    async def get_all_jobs(self, session : AsyncSession, page: int = 1,page_size: int = 10,search: Optional[str] = None,status: Optional[str] = None):
-        statement = select(JobApplication).where(JobApplication.deleted_at == None).options(selectinload(JobApplication.status).load_only(JobTimeline.event_type)) # type: ignore
-        
+    def _job_filters(self, statement, user_id: Optional[uuid.UUID] = None, search: Optional[str] = None, status: Optional[Status] = None):
+        # the data and the count queries must agree on exactly these predicates
+        statement = statement.where(JobApplication.deleted_at == None)
+        if user_id is not None:
+            statement = statement.where(JobApplication.user_uid == user_id)
         if search:
             statement = statement.where(
                 or_(
-                    JobApplication.company_name.ilike(f"%{search}%"),  # type: ignore[attr-defined] # prefix search
-                    JobApplication.job_title.ilike(f"%{search}%")# type: ignore[attr-defined]
+                    JobApplication.company_name.ilike(f"%{search}%"),  # type: ignore[attr-defined]
+                    JobApplication.job_title.ilike(f"%{search}%")  # type: ignore[attr-defined]
                 )
             )
-        
         if status:
-            statement = statement.where(JobApplication.status == status) # type: ignore
-        
-        offset = (page - 1) * page_size
-        statement = statement.order_by(desc(JobApplication.created_at)).offset(offset).limit(page_size)
+            statement = statement.where(JobApplication.current_status == status)
+        return statement
 
-        result = await session.exec(statement)
-        jobs = result.all()
+    async def _count_jobs(self, session: AsyncSession, count: CountMode, user_id: Optional[uuid.UUID], search: Optional[str], status: Optional[Status]) -> Optional[int]:
+        if count == "none":
+            return None
 
-        count_statement = select(func.count()).select_from(JobApplication).where(JobApplication.deleted_at == None)
-        if search:
-            count_statement = count_statement.where(
-                or_(
-                    JobApplication.company_name.ilike(f"{search}%"),# type: ignore[attr-defined]
-                    JobApplication.job_title.ilike(f"{search}%")# type: ignore[attr-defined]
-                )
-            )
-        if status:
-            statement = statement.where(JobApplication.status == status) # type: ignore
+        filtered = self._job_filters(select(JobApplication.id), user_id, search, status)
+        if count == "estimated":
+            return await estimate_count(session, filtered)
+
+        key = (user_id, search.lower() if search else None, status)
+        total = count_cache.get(key)
+        if total is None:
+            result = await session.exec(select(func.count()).select_from(filtered.subquery()))
+            total = result.one()
+            count_cache.set(key, total)
+        return total
+
+    async def _list_jobs(self, session: AsyncSession, statement, user_id: Optional[uuid.UUID], page: int, page_size: int, search: Optional[str], status: Optional[Status], cursor: Optional[str], keyset: bool, count: CountMode):
+        search = search.strip() if search else None
+        statement = self._job_filters(statement, user_id, search, status)
 
-        total_result = await session.exec(count_statement)
-        total_count = total_result.one()
+        if keyset:
+            result = await session.exec(apply_keyset(statement, JOB_KEYSET, cursor, page_size))
+            return cursor_page(result.all(), JOB_KEYSET, page_size)
+
+        # one extra row tells us whether there is a next page without counting
+        offset = (page - 1) * page_size
+        statement = statement.order_by(desc(JobApplication.created_at)).offset(offset).limit(page_size + 1)
+        result = await session.exec(statement)
+        jobs = result.all()
 
         return {
-            "data": jobs,
+            "data": jobs[:page_size],
             "page": page,
             "page_size": page_size,
-            "total": total_count
+            "total": await self._count_jobs(session, count, user_id, search, status),
+            "has_more": len(jobs) > page_size
         }
-    
-    async def get_user_jobs(self, user_id:uuid.UUID, session : AsyncSession, page: int = 1,page_size: int = 10,search: Optional[str] = None,status: Optional[str] = None):
-        statement = select(JobApplication).where(JobApplication.user_uid == user_id,JobApplication.deleted_at == None).options(joinedload(JobApplication.status).load_only(JobTimeline.status)) # type: ignore
-        if search:
-            statement = statement.where(
-                or_(
-                    JobApplication.company_name.ilike(f"%{search}%"),   # type: ignore[attr-defined]# prefix search
-                    JobApplication.job_title.ilike(f"%{search}%") # type: ignore[attr-defined]
-                )
-            )
-        
-        if status:
-            statement = statement.join(JobTimeline).where(JobTimeline.status == status) # type: ignore
-        
-        offset = (page - 1) * page_size
-        statement = statement.order_by(desc(JobApplication.created_at)).offset(offset).limit(page_size)
 
+    async def get_all_jobs(self, session : AsyncSession, page: int = 1,page_size: int = 10,search: Optional[str] = None,status: Optional[Status] = None, cursor: Optional[str] = None, keyset: bool = False, count: CountMode = "exact"):
+        statement = select(JobApplication)
+        return await self._list_jobs(session, statement, None, page, page_size, search, status, cursor, keyset, count)
+
+    async def get_user_jobs(self, user_id:uuid.UUID, session : AsyncSession, page: int = 1,page_size: int = 10,search: Optional[str] = None,status: Optional[Status] = None, cursor: Optional[str] = None, keyset: bool = False, count: CountMode = "exact"):
+        statement = select(JobApplication)
+        return await self._list_jobs(session, statement, user_id, page, page_size, search, status, cursor, keyset, count)
+
+    async def count_user_jobs_by_status(self, user_id:uuid.UUID, session:AsyncSession) -> dict:
+        statement = select(JobApplication.current_status, func.count()).where(
+            JobApplication.user_uid == user_id,
+            JobApplication.deleted_at == None
+        ).group_by(JobApplication.current_status)
         result = await session.exec(statement)
-        jobs = result.unique().all()
 
-        count_statement = select(func.count()).select_from(JobApplication).where(JobApplication.deleted_at == None, JobApplication.user_uid == user_id)
-        if search:
-            count_statement = count_statement.where(
-                or_(
-                    JobApplication.company_name.ilike(f"{search}%"),# type: ignore[attr-defined]
-                    JobApplication.job_title.ilike(f"{search}%")# type: ignore[attr-defined]
-                )
-            )
-        if status:
-            statement = statement.join(JobTimeline).where(JobTimeline.status == status) # type: ignore
+        # applications whose timelines were all undone have no status, they still count
+        counts = {status.value: 0 for status in Status}
+        counts[NO_STATUS] = 0
+        for status, total in result.all():
+            counts[status.value if status is not None else NO_STATUS] = total
+        return counts
 
-        total_result = await session.exec(count_statement)
-        total_count = total_result.one()
+    def _job_statement(self, job_uid:str, user_id:uuid.UUID):
+        return select(JobApplication).where(JobApplication.id == job_uid, JobApplication.deleted_at == None, JobApplication.user_uid == user_id)
 
-        data = [JobApplication.model_validate(job) for job in jobs]
-        
-        return {
-            "data": data,
-            "page": page,
-            "page_size": page_size,
-            "total": total_count
-        }
-        
     async def get_job(self,job_uid:str, user_id:uuid.UUID, session:AsyncSession):
-        statement = select(JobApplication).where(JobApplication.id == job_uid, JobApplication.deleted_at == None, JobApplication.user_uid == user_id).options(
+        statement = self._job_statement(job_uid, user_id).options(
             selectinload(JobApplication.timelines),  # type: ignore[arg-type]
             selectinload(JobApplication.job_interviews),  # type: ignore[arg-type]
-            joinedload(JobApplication.status).load_only(JobTimeline.status) # type: ignore[arg-type]
         )
         result = await session.exec(statement)
         job_application = result.first()
         return job_application if job_application is not None else None
     
     async def create_job(self, job_data:JobApplicationCreateModel,user_uid:uuid.UUID, session:AsyncSession):
-        job_data_dict = job_data.model_dump()
-        
+        # the application and its SAVED timeline go out in one flush and one transaction,
+        # the caller already owns the row so there is nothing to re-check
         new_data = JobApplication(
-            **job_data_dict
+            **job_data.model_dump(),
+            id=uuid.uuid4(),
+            user_uid=user_uid,
+            current_status=Status.SAVED,
         )
-        
-        new_data.user_uid = user_uid
-        session.add(new_data)
-        await session.flush()
-        
-        await self.timeline_service.create_job_timeline(
-            JobTimelineCreateModel(
-                event_type=JobApplicationEvent.SAVED,
-                status=EVENT_TO_STATUS[JobApplicationEvent.SAVED],
-                event_date=datetime.combine(new_data.application_date, datetime.min.time()),
-                notes=""
-            ),
+        saved_timeline = JobTimeline(
             job_application_id=new_data.id,
-            user_id=new_data.user_uid,
-            session=session
+            event_type=JobApplicationEvent.SAVED,
+            status=EVENT_TO_STATUS[JobApplicationEvent.SAVED],
+            event_date=new_data.application_date,
+            notes="",
         )
+        session.add_all([new_data, saved_timeline])
         await session.commit()
-        
+
         return new_data
         
     
+    async def import_jobs(self, chunks:AsyncIterator[bytes], fmt:ImportFormat, user_uid:uuid.UUID, session:AsyncSession):
+        return await import_job_applications(chunks, fmt, user_uid, session)
+
+    def export_jobs(self, request:Request, fmt:ExportFormat, user_uid:Optional[uuid.UUID] = None) -> AsyncIterator[str]:
+        return stream_job_applications(request, fmt, user_uid)
+
     async def update_job(self, job_uid:str, user_id:uuid.UUID,  update_data:JobApplicationUpdateModel, session:AsyncSession):
-        job_application_to_update = await self.get_job(job_uid, user_id, session)
+        result = await session.exec(self._job_statement(job_uid, user_id))
+        job_application_to_update = result.first()
 
         if job_application_to_update is None :
             return None
@@ -154,25 +164,45 @@ class JobApplicationService:
         return job_application_to_update
         
     
-    async def delete_job(self, job_uid:str, user_id:uuid.UUID, session:AsyncSession):
-        statement = select(JobApplication).where(JobApplication.id == job_uid, JobApplication.user_uid ==  user_id)
-        result = await session.exec(statement)
-        job_application_to_delete = result.first()
-        
-        if job_application_to_delete is not None:
-            job_application_to_delete.deleted_at = datetime.now()
-            
-            statement = select(JobInterview).where(
-                JobInterview.job_application_id == job_uid,
-                JobInterview.deleted_at == None
-            )
-            result = await session.exec(statement)
-            interviews = result.all()
+    def _soft_delete_statement(self, user_id:uuid.UUID, job_uids:Optional[list[uuid.UUID]] = None):
+        """One statement that soft-deletes the user's live applications and their children.
 
-            for interview in interviews:
-                interview.deleted_at = datetime.now()
+        Data-modifying CTEs all see the same snapshot and stamp the same
+        ``deleted_at``, so the cascade is atomic without any rows reaching Python.
+        ``job_uids`` limits it to those applications, ``None`` takes all of them.
+        """
+        deleted_at = datetime.now()
+        applications = update(JobApplication).where(
+            JobApplication.user_uid == user_id,
+            JobApplication.deleted_at == None,
+        )
+        if job_uids is not None:
+            applications = applications.where(JobApplication.id.in_(job_uids))  # type: ignore[attr-defined]
+        applications_cte = applications.values(deleted_at=deleted_at).returning(JobApplication.id).cte("deleted_applications")
+
+        deleted_ids = select(applications_cte.c.id)
+        interviews_cte = update(JobInterview).where(
+            JobInterview.job_application_id.in_(deleted_ids),  # type: ignore[union-attr]
+            JobInterview.deleted_at == None,
+        ).values(deleted_at=deleted_at).cte("deleted_interviews")
+        timelines_cte = update(JobTimeline).where(
+            JobTimeline.job_application_id.in_(deleted_ids),  # type: ignore[union-attr]
+            JobTimeline.deleted_at == None,
+        ).values(deleted_at=deleted_at).cte("deleted_timelines")
 
-            await session.commit()
-            return job_application_to_delete
-        else:
-            return None
\ No newline at end of file
+        # the child CTEs are never selected from, add_cte makes sure they are emitted
+        return select(applications_cte.c.id).add_cte(interviews_cte, timelines_cte)
+
+    async def delete_jobs(self, user_id:uuid.UUID, session:AsyncSession, job_uids:Optional[list[uuid.UUID]] = None) -> list[uuid.UUID]:
+        result = await session.exec(self._soft_delete_statement(user_id, job_uids))
+        deleted = list(result.all())
+        await session.commit()
+        return deleted
+
+    async def delete_job(self, job_uid:str, user_id:uuid.UUID, session:AsyncSession):
+        try:
+            job_id = uuid.UUID(job_uid)
+        except ValueError:
+            return None
+        deleted = await self.delete_jobs(user_id, session, [job_id])
+        return deleted[0] if deleted else None
\ No newline at end of file
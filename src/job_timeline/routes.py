@@ -1,5 +1,5 @@
-from fastapi import APIRouter, status, Depends, Body
-from src.auth.dependencies import RoleChecker, get_current_user, get_timeline_service
+from fastapi import APIRouter, status, Depends, Body, Query
+from src.auth.dependencies import RoleChecker, get_current_user, get_read_session, get_timeline_service
 from src.db.models import JobTimeline, User
 from src.db.main import get_session
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -7,7 +7,9 @@ from .services import JobTimelineService
 from fastapi.exceptions import HTTPException
 from fastapi.responses import JSONResponse
 from src.job_timeline.schemas import JobTimelineCreateModel, JobTimelineUpdateModel
-from typing import Annotated
+from typing import Annotated, Optional
+from src.core.pagination import CursorPaginatedResponse, child_list_page_size
+from src.config import Config
 import uuid
 
 job_timeline_router = APIRouter(
@@ -15,23 +17,29 @@ job_timeline_router = APIRouter(
     tags=["Job Timelines"],
 )
 
-role_checker_standard = Depends(RoleChecker(["ADMIN", "USER", "GUEST"]))
+role_checker_standard = Depends(RoleChecker(["ADMIN", "USER", "GUEST"], claims_only=True))
 Session = Annotated[AsyncSession, Depends(get_session)]
+ReadSession = Annotated[AsyncSession, Depends(get_read_session)]
 JobTimelineServices = Annotated[JobTimelineService, Depends(get_timeline_service)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
 @job_timeline_router.get(
-    "/", response_model=list[JobTimeline], dependencies=[role_checker_standard]
+    "/",
+    response_model=list[JobTimeline] | CursorPaginatedResponse[JobTimeline],
+    dependencies=[role_checker_standard],
 )
 async def get_all_job_timelines(
     job_application_id: str,
-    session: Session,
+    session: ReadSession,
     job_timeline_services: JobTimelineServices,
     current_user: CurrentUser,
+    page_size: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
 ):
+    page_size = child_list_page_size(page_size, cursor)
     job_timelines = await job_timeline_services.get_all_timelines_by_app_id(
-        job_application_id, current_user.id, session
+        job_application_id, current_user.id, session, page_size, cursor
     )
     return job_timelines
 
@@ -44,11 +52,11 @@ async def get_all_job_timelines(
 async def get_job_timeline_by_id(
     job_application_id: str,
     job_timeline_id: str,
-    session: Session,
+    session: ReadSession,
     job_timeline_services: JobTimelineServices,
     current_user: CurrentUser,
 ):
-    job_timeline = job_timeline_services.get_timelines_by_id(
+    job_timeline = await job_timeline_services.get_timelines_by_id(
         job_application_id, job_timeline_id, current_user.id, session
     )
     if job_timeline is not None:
@@ -79,6 +87,28 @@ async def create_job_application(
     return job_timeline
 
 
+@job_timeline_router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=list[JobTimeline],
+    response_model_exclude_none=True,
+    dependencies=[role_checker_standard],
+)
+async def create_job_timelines(
+    job_application_id: uuid.UUID,
+    session: Session,
+    job_timeline_services: JobTimelineServices,
+    current_user: CurrentUser,
+    timelines_data: list[JobTimelineCreateModel] = Body(
+        ..., min_length=1, max_length=Config.BATCH_MAX_ITEMS
+    ),
+):
+    job_timelines = await job_timeline_services.create_job_timelines(
+        timelines_data, job_application_id, current_user.id, session
+    )
+    return job_timelines
+
+
 @job_timeline_router.delete(
     "/undo",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -1,31 +1,79 @@
 import uuid
-from datetime import datetime
-from sqlmodel import desc, select
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlmodel import delete, desc, func, insert, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
-from src.helper.ownership import ensure_job_belongs_to_user
+from src.helper.ownership import confirm_ownership, ensure_job_belongs_to_user, lock_owned_job, owned_job_filter
 from src.job_timeline.schemas import (
     EVENT_TO_STATUS,
     JobTimelineCreateModel,
     JobTimelineUpdateModel,
 )
-from ..db.models import  JobTimeline
+from src.core.pagination import apply_keyset, cursor_page
+from src.job_application.enums import Status
+from ..db.models import  JobApplication, JobTimeline
+
+TIMELINE_KEYSET = (JobTimeline.event_date, JobTimeline.id)
 
 
 class JobTimelineService:
-    async def get_all_timelines_by_app_id(
-        self, job_application_id: str, user_id: uuid.UUID, session: AsyncSession
+    async def _sync_current_status(
+        self,
+        job_application_id,
+        session: AsyncSession,
+        status: Optional[Status] = None,
     ):
-        await ensure_job_belongs_to_user(job_application_id, user_id, session)
-        statement = (
-            select(JobTimeline)
-            .where(
-                JobTimeline.job_application_id == job_application_id,
-                JobTimeline.deleted_at == None,
+        """Copy the latest live timeline's status onto the application.
+
+        Runs inside the caller's transaction so the column commits together
+        with the timeline write. ``status`` skips the lookup when the caller
+        has just added the newest timeline.
+        """
+        if status is None:
+            status = (
+                select(JobTimeline.status)
+                .where(
+                    JobTimeline.job_application_id == job_application_id,
+                    JobTimeline.deleted_at == None,
+                )
+                .order_by(desc(JobTimeline.created_at), desc(JobTimeline.id))
+                .limit(1)
+                .scalar_subquery()
             )
-            .order_by(desc(JobTimeline.event_date))
+        await session.exec(
+            update(JobApplication)
+            .where(JobApplication.id == job_application_id)  # type: ignore[arg-type]
+            .values(current_status=status)
         )
-        result = await session.exec(statement)
-        return result.all()
+
+    async def get_all_timelines_by_app_id(
+        self,
+        job_application_id: str,
+        user_id: uuid.UUID,
+        session: AsyncSession,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        statement = owned_job_filter(
+            select(JobTimeline).where(JobTimeline.deleted_at == None),
+            JobTimeline,
+            job_application_id,
+            user_id,
+            session,
+        )
+
+        if page_size is not None:
+            result = await session.exec(
+                apply_keyset(statement, TIMELINE_KEYSET, cursor, page_size)
+            )
+            rows = result.all()
+            await confirm_ownership(bool(rows), job_application_id, user_id, session)
+            return cursor_page(rows, TIMELINE_KEYSET, page_size)
+
+        result = await session.exec(statement.order_by(desc(JobTimeline.event_date)))
+        job_timelines = result.all()
+        await confirm_ownership(bool(job_timelines), job_application_id, user_id, session)
+        return job_timelines
 
     async def get_timelines_by_id(
         self,
@@ -34,14 +82,19 @@ class JobTimelineService:
         user_id: uuid.UUID,
         session: AsyncSession,
     ):
-        await ensure_job_belongs_to_user(job_application_id, user_id, session)
-        statement = select(JobTimeline).where(
-            JobTimeline.job_application_id == job_application_id,
-            JobTimeline.id == job_timeline_id,
-            JobTimeline.deleted_at == None,
+        statement = owned_job_filter(
+            select(JobTimeline).where(
+                JobTimeline.id == job_timeline_id,
+                JobTimeline.deleted_at == None,
+            ),
+            JobTimeline,
+            job_application_id,
+            user_id,
+            session,
         )
         result = await session.exec(statement)
         job_timeline = result.first()
+        await confirm_ownership(job_timeline is not None, job_application_id, user_id, session)
         return job_timeline
 
     async def create_job_timeline(
@@ -59,11 +112,46 @@ class JobTimelineService:
         new_data.job_application_id = job_application_id
         new_data.status = EVENT_TO_STATUS[new_data.event_type]
         session.add(new_data)
+        await self._sync_current_status(job_application_id, session, new_data.status)
 
         await session.commit()
         await session.refresh(new_data)
         return new_data
 
+    async def create_job_timelines(
+        self,
+        timelines_data: list[JobTimelineCreateModel],
+        job_application_id: uuid.UUID,
+        user_id: uuid.UUID,
+        session: AsyncSession,
+    ):
+        """Insert every timeline in one statement and one transaction.
+
+        List order is event order: each row's created_at is a microsecond
+        after the previous one, so the last item decides the current status.
+        """
+        await ensure_job_belongs_to_user(str(job_application_id), user_id, session)
+        now = datetime.now()
+        rows = [
+            {
+                **timeline_data.model_dump(),
+                "id": uuid.uuid4(),
+                "job_application_id": job_application_id,
+                "status": EVENT_TO_STATUS[timeline_data.event_type],
+                "created_at": now + timedelta(microseconds=position),
+                "updated_at": now,
+            }
+            for position, timeline_data in enumerate(timelines_data)
+        ]
+
+        statement = insert(JobTimeline).values(rows).returning(JobTimeline)
+        result = await session.exec(statement)  # type: ignore[call-overload]
+        new_timelines = result.scalars().all()
+        await self._sync_current_status(job_application_id, session, rows[-1]["status"])
+
+        await session.commit()
+        return new_timelines
+
     async def update_job_timeline(
         self,
         job_application_id: str,
@@ -79,6 +167,9 @@ class JobTimelineService:
             update_data_dict = update_data.model_dump(exclude_unset=True)
             for key, value in update_data_dict.items():
                 setattr(job_timeline_to_update, key, value)
+            if update_data_dict.get("event_type") is not None:
+                job_timeline_to_update.status = EVENT_TO_STATUS[update_data_dict["event_type"]]
+                await self._sync_current_status(job_application_id, session)
 
             await session.commit()
             return job_timeline_to_update
@@ -97,6 +188,7 @@ class JobTimelineService:
         )
         if job_timeline_to_delete is not None:
             job_timeline_to_delete.deleted_at = datetime.now()
+            await self._sync_current_status(job_application_id, session)
 
             await session.commit()
             return job_timeline_to_delete
@@ -106,26 +198,31 @@ class JobTimelineService:
     async def undo_job_timeline(
         self, job_application_id: str, user_id: uuid.UUID, session: AsyncSession
     ):
-        await ensure_job_belongs_to_user(str(job_application_id), user_id, session)
-
-        statement = (
-            select(JobTimeline)
+        # the parent lock queues concurrent undo/reset on this application, so the
+        # newest row is chosen only after the previous writer has committed
+        await lock_owned_job(job_application_id, user_id, session)
+        latest = (
+            select(JobTimeline.id)
             .where(
                 JobTimeline.job_application_id == job_application_id,
                 JobTimeline.deleted_at == None,
             )
-            .order_by(desc(JobTimeline.created_at))
+            .order_by(desc(JobTimeline.created_at), desc(JobTimeline.id))
+            .limit(1)
+        )
+        statement = (
+            delete(JobTimeline)
+            .where(JobTimeline.id.in_(latest.scalar_subquery()))  # type: ignore[union-attr]
+            .returning(JobTimeline)
         )
 
-        result = await session.exec(statement)
-        all_timelines = result.all()
+        result = await session.exec(statement)  # type: ignore[call-overload]
+        latest_timeline = result.scalars().first()
 
-        if len(all_timelines) < 1:
+        if latest_timeline is None:
             return None
 
-        latest_timeline = all_timelines[0]
-
-        await session.delete(latest_timeline)
+        await self._sync_current_status(job_application_id, session)
         await session.commit()
 
         return latest_timeline
@@ -133,28 +230,40 @@ class JobTimelineService:
     async def reset_job_timeline(
         self, job_application_id: str, user_id: uuid.UUID, session: AsyncSession
     ):
-        await ensure_job_belongs_to_user(str(job_application_id), user_id, session)
-
-        statement = (
-            select(JobTimeline)
+        await lock_owned_job(job_application_id, user_id, session)
+        # one statement: pick the oldest live timeline and delete every other one
+        kept = (
+            select(JobTimeline.id, JobTimeline.status)
             .where(
                 JobTimeline.job_application_id == job_application_id,
                 JobTimeline.deleted_at == None,
             )
-            .order_by(desc(JobTimeline.created_at))
+            .order_by(JobTimeline.created_at, JobTimeline.id)
+            .limit(1)
+            .cte("kept")
+        )
+        deleted = (
+            delete(JobTimeline)
+            .where(
+                JobTimeline.job_application_id == job_application_id,
+                JobTimeline.deleted_at == None,
+                JobTimeline.id != select(kept.c.id).scalar_subquery(),
+            )
+            .returning(JobTimeline.id)
+            .cte("deleted")
+        )
+        statement = select(
+            kept.c.status,
+            select(func.count()).select_from(deleted).scalar_subquery(),
         )
 
         result = await session.exec(statement)
-        all_timelines = result.all()
+        kept_timeline = result.first()
 
-        if len(all_timelines) < 1:
+        if kept_timeline is None:
             return None
 
-        timelines_to_delete = all_timelines[:-1]
-
-        for timeline in timelines_to_delete:
-            await session.delete(timeline)
-
+        await self._sync_current_status(job_application_id, session, kept_timeline.status)
         await session.commit()
 
         return True
@@ -167,7 +276,6 @@ class JobTimelineService:
         note_update: str,
         session: AsyncSession,
     ):
-        await ensure_job_belongs_to_user(str(job_application_id), user_id, session)
         job_timeline_to_update = await self.get_timelines_by_id(
             job_application_id, timeline_id, user_id, session
         )
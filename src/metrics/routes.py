@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends
+from src.auth.dependencies import RoleChecker
+from src.auth.services import user_cache
+from src.auth.utils import token_cache
+from src.db.redis import revocation_cache, get_redis
+from src.db.main import pool_stats, async_engine, replica_engine
+
+metrics_router = APIRouter()
+role_checker_admin = Depends(RoleChecker(["ADMIN"], claims_only=True))
+
+
+@metrics_router.get("/cache", dependencies=[role_checker_admin])
+async def get_cache_stats():
+    return {
+        "users": user_cache.stats(),
+        "tokens": token_cache.stats(),
+        "revocations": revocation_cache.stats(),
+    }
+
+
+@metrics_router.get("/redis", dependencies=[role_checker_admin])
+async def get_redis_stats():
+    return get_redis().stats()
+
+
+@metrics_router.get("/db-pool", dependencies=[role_checker_admin])
+async def get_db_pool_stats():
+    return {
+        "primary": pool_stats(async_engine),
+        "replica": pool_stats(replica_engine) if replica_engine is not None else None,
+    }
@@ -1,4 +1,6 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from src.config import Config
+from src.db.main import mark_write
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
@@ -15,4 +17,14 @@ def register_middleware(app:FastAPI):
     app.add_middleware(
         TrustedHostMiddleware,
         allowed_hosts=['localhost', '127.0.0.1']
-    )
\ No newline at end of file
+    )
+    
+    if Config.DATABASE_REPLICA_URL:
+        @app.middleware("http")
+        async def pin_writers_to_primary(request: Request, call_next):
+            response = await call_next(request)
+            if request.method not in ("GET", "HEAD", "OPTIONS"):
+                token_details = getattr(request.state, "token_details", None)
+                if token_details is not None:
+                    await mark_write(token_details["user"].get("user_id"))
+            return response
@@ -0,0 +1,61 @@
+"""Compare the ilike listing search with ranked full-text search.
+
+    python -m src.search.benchmark --user-id <uuid> --term acme kubernetes --runs 50
+
+Runs both paths against the configured database for one user's
+applications and prints latency percentiles per term. Point it at a
+database seeded to production size (e.g. 1M applications) to get
+meaningful numbers.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from src.db.main import async_engine, async_session_maker
+from src.job_application.services import JobApplicationService
+from src.job_timeline.services import JobTimelineService
+from .service import SearchService
+
+
+async def measure(run, runs: int) -> list[float]:
+    await run()  # warm up plans and the buffer cache
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def benchmark(user_id: uuid.UUID, terms: list[str], runs: int, page_size: int) -> None:
+    jobs = JobApplicationService(JobTimelineService())
+    search = SearchService()
+
+    print(f"{'term':<20} {'path':<9} {'p50 ms':>8} {'p95 ms':>8} {'hits':>5}")
+    async with async_session_maker() as session:
+        for term in terms:
+            paths = {
+                "ilike": lambda: jobs.get_user_jobs(user_id, session, page_size=page_size, search=term, count="none"),
+                "fulltext": lambda: search.fulltext_page(user_id, term, session, page_size),
+            }
+            for name, run in paths.items():
+                timings = await measure(run, runs)
+                hits = len((await run())["data"])
+                p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+                print(f"{term:<20} {name:<9} {statistics.median(timings):>8.2f} {p95:>8.2f} {hits:>5}")
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=uuid.UUID, required=True)
+    parser.add_argument("--term", nargs="+", required=True)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.user_id, args.term, args.runs, args.page_size))
+
+
+if __name__ == "__main__":
+    main()
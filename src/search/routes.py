@@ -0,0 +1,33 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.auth.dependencies import RoleChecker, get_current_user, get_read_session
+from src.db.models import User
+from .schemas import JobApplicationSearchResponse, SuggestResponse
+from .service import SearchService
+
+search_router = APIRouter()
+search_service = SearchService()
+role_checker_standard = Depends(RoleChecker(["ADMIN", "USER", "GUEST"], claims_only=True))
+
+
+@search_router.get("/job_applications", response_model=JobApplicationSearchResponse, dependencies=[role_checker_standard])
+async def search_job_applications(
+    q: str = Query(..., min_length=1, max_length=200),
+    page_size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    fuzzy: bool = True,
+    session: AsyncSession = Depends(get_read_session),
+    current_user: User = Depends(get_current_user),
+):
+    return await search_service.search_jobs(current_user.id, q, session, page_size, cursor, fuzzy)
+
+
+@search_router.get("/suggest", response_model=SuggestResponse, dependencies=[role_checker_standard])
+async def suggest_job_applications(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(5, ge=1, le=20),
+    session: AsyncSession = Depends(get_read_session),
+    current_user: User = Depends(get_current_user),
+):
+    return await search_service.suggest(current_user.id, q, session, limit)
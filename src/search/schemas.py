@@ -0,0 +1,20 @@
+from typing import List, Literal
+from pydantic import BaseModel
+from src.core.pagination import CursorPaginatedResponse
+from src.job_application.schemas import JobApplication
+
+
+class JobApplicationSearchHit(JobApplication):
+    rank:float
+
+class JobApplicationSearchResponse(CursorPaginatedResponse[JobApplicationSearchHit]):
+    match:Literal["fulltext", "trigram"]
+
+
+class Suggestion(BaseModel):
+    value:str
+    count:int
+
+class SuggestResponse(BaseModel):
+    companies:List[Suggestion]
+    titles:List[Suggestion]
@@ -0,0 +1,136 @@
+import logging
+from typing import Optional, Sequence
+from sqlalchemy import Float, exc, func, literal_column, or_, text
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.pagination import apply_keyset, cursor_page
+from src.config import Config
+from src.core.cache import TTLCache
+from src.db.models import JobApplication, JobApplicationSearch
+import uuid
+
+# must match the text search config the search triggers build documents with
+SEARCH_CONFIG = "simple"
+
+# trigram pages rank on a different score, their cursors are marked so the next page stays fuzzy
+TRIGRAM_CURSOR_PREFIX = "~"
+
+QUERY_CANCELED = "57014"
+
+# typeahead results keyed by (user, lower-cased prefix, limit)
+suggest_cache = TTLCache(maxsize=Config.SUGGEST_CACHE_MAXSIZE, ttl=Config.SUGGEST_CACHE_TTL)
+
+
+def _like_prefix(prefix: str) -> str:
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+class SearchService:
+    def _user_filters(self, user_id: uuid.UUID) -> tuple:
+        return (JobApplication.user_uid == user_id, JobApplication.deleted_at == None)
+
+    async def _ranked_page(self, session: AsyncSession, statement, keys: Sequence, page_size: int, cursor: Optional[str], match: str) -> dict:
+        result = await session.exec(apply_keyset(statement, keys, cursor, page_size))
+        page = cursor_page(result.all(), keys, page_size, key_values=lambda row: (row[1], row[0].id))
+        page["data"] = [{**job.model_dump(), "rank": rank} for job, rank in page["data"]]
+        page["match"] = match
+        return page
+
+    async def fulltext_page(self, user_id: uuid.UUID, term: str, session: AsyncSession, page_size: int, cursor: Optional[str] = None) -> dict:
+        query = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), term)
+        rank = func.ts_rank_cd(JobApplicationSearch.document, query, type_=Float)
+        statement = (
+            select(JobApplication, rank)
+            .join(JobApplicationSearch, JobApplicationSearch.job_application_id == JobApplication.id)  # type: ignore[arg-type]
+            .where(*self._user_filters(user_id), JobApplicationSearch.document.bool_op("@@")(query))  # type: ignore[union-attr]
+        )
+        return await self._ranked_page(session, statement, (rank, JobApplication.id), page_size, cursor, "fulltext")
+
+    async def trigram_page(self, user_id: uuid.UUID, term: str, session: AsyncSession, page_size: int, cursor: Optional[str] = None) -> dict:
+        similarity = func.greatest(
+            func.similarity(JobApplication.company_name, term),
+            func.similarity(JobApplication.job_title, term),
+            type_=Float,
+        )
+        statement = select(JobApplication, similarity).where(
+            *self._user_filters(user_id),
+            # % is the pg_trgm similarity operator, served by idx_company_trgm / idx_title_trgm
+            or_(
+                JobApplication.company_name.bool_op("%")(term),  # type: ignore[attr-defined]
+                JobApplication.job_title.bool_op("%")(term)  # type: ignore[attr-defined]
+            )
+        )
+        page = await self._ranked_page(session, statement, (similarity, JobApplication.id), page_size, cursor, "trigram")
+        if page["next_cursor"]:
+            page["next_cursor"] = TRIGRAM_CURSOR_PREFIX + page["next_cursor"]
+        return page
+
+    async def search_jobs(self, user_id: uuid.UUID, term: str, session: AsyncSession, page_size: int = 10, cursor: Optional[str] = None, fuzzy: bool = True) -> dict:
+        """Ranked full-text search over the user's applications and their notes.
+
+        When the first page has no full-text match (usually a typo) and
+        ``fuzzy`` is on, falls back to trigram similarity on company and title.
+        """
+        if cursor and cursor.startswith(TRIGRAM_CURSOR_PREFIX):
+            return await self.trigram_page(user_id, term, session, page_size, cursor[len(TRIGRAM_CURSOR_PREFIX):])
+
+        page = await self.fulltext_page(user_id, term, session, page_size, cursor)
+        if fuzzy and cursor is None and not page["data"]:
+            return await self.trigram_page(user_id, term, session, page_size)
+        return page
+
+    def _cached_suggestions(self, user_id: uuid.UUID, prefix: str, limit: int) -> Optional[dict]:
+        # a shorter prefix that returned fewer than ``limit`` values per field already holds every match
+        for end in range(len(prefix), 0, -1):
+            cached = suggest_cache.get((user_id, prefix[:end], limit))
+            if cached is None:
+                continue
+            if end == len(prefix):
+                return cached
+            if all(len(values) < limit for values in cached.values()):
+                return {
+                    field: [item for item in values if item["value"].lower().startswith(prefix)]
+                    for field, values in cached.items()
+                }
+        return None
+
+    async def _prefix_counts(self, user_id: uuid.UUID, column, prefix: str, limit: int, session: AsyncSession) -> list[dict]:
+        total = func.count().label("count")
+        statement = (
+            select(column, total)
+            .where(*self._user_filters(user_id), column.ilike(_like_prefix(prefix), escape="\\"))
+            .group_by(column)
+            .order_by(total.desc(), column)
+            .limit(limit)
+        )
+        result = await session.exec(statement)
+        return [{"value": value, "count": count} for value, count in result.all()]
+
+    async def suggest(self, user_id: uuid.UUID, prefix: str, session: AsyncSession, limit: int = 5) -> dict:
+        """Distinct company names and job titles starting with ``prefix``, most used first.
+
+        Served from a short-lived per-user cache. Misses run under
+        SUGGEST_TIMEOUT_MS and answer with no suggestions rather than
+        holding up the keystroke when the budget is exceeded.
+        """
+        prefix = prefix.strip().lower()
+        cached = self._cached_suggestions(user_id, prefix, limit)
+        if cached is not None:
+            return cached
+
+        try:
+            await session.exec(text(f"SET LOCAL statement_timeout = {int(Config.SUGGEST_TIMEOUT_MS)}"))  # type: ignore[call-overload]
+            suggestions = {
+                "companies": await self._prefix_counts(user_id, JobApplication.company_name, prefix, limit, session),
+                "titles": await self._prefix_counts(user_id, JobApplication.job_title, prefix, limit, session),
+            }
+        except exc.DBAPIError as e:
+            if getattr(e.orig, "sqlstate", None) != QUERY_CANCELED:
+                raise
+            logging.warning("suggest for %r exceeded %sms", prefix, Config.SUGGEST_TIMEOUT_MS)
+            await session.rollback()
+            return {"companies": [], "titles": []}
+
+        suggest_cache.set((user_id, prefix, limit), suggestions)
+        return suggestions
@@ -0,0 +1,48 @@
+"""A batch create writes every row or none of them."""
+import pytest
+
+from conftest import API, create_application
+
+TIMELINE = {"event_type": "APPLIED", "event_date": "2025-03-01T00:00:00", "notes": "batch"}
+INTERVIEW = {"interview_type": "video", "interview_date": "2025-03-02T00:00:00", "interviewer_name": "Kim", "notes": "batch"}
+
+# invalid_row builds the bad row from a valid one: the first is rejected by
+# validation, the second passes validation and is only refused by Postgres
+# (text columns cannot hold NUL), so it has to roll back inside the database
+INVALID_ROWS = {
+    "validation": lambda row: {**row, "notes": None},
+    "database": lambda row: {**row, "notes": "bad\x00row"},
+}
+
+BATCHES = {
+    "timelines": ("job-timelines", TIMELINE),
+    "interviews": ("interviews", INTERVIEW),
+}
+
+
+def post_rejected_batch(client, headers, url, rows, failure) -> None:
+    if failure == "validation":
+        assert client.post(url, headers=headers, json=rows).status_code == 422
+        return
+    from sqlalchemy.exc import DBAPIError
+
+    # the test client re-raises server errors instead of returning a 500
+    with pytest.raises(DBAPIError):
+        client.post(url, headers=headers, json=rows)
+
+
+@pytest.mark.parametrize("failure", INVALID_ROWS)
+@pytest.mark.parametrize("batch", BATCHES)
+def test_one_invalid_row_fails_the_whole_batch(client, headers, batch, failure):
+    resource, row = BATCHES[batch]
+    job_id = create_application(client, headers)
+    list_url = f"{API}/job-applications/{job_id}/{resource}/"
+    before = client.get(list_url, headers=headers).json()
+    status_before = client.get(f"{API}/job_applications/{job_id}", headers=headers).json()["current_status"]
+
+    rows = [row, row, INVALID_ROWS[failure](row)]
+    post_rejected_batch(client, headers, f"{API}/job-applications/{job_id}/{resource}/batch", rows, failure)
+
+    assert client.get(list_url, headers=headers).json() == before
+    detail = client.get(f"{API}/job_applications/{job_id}", headers=headers).json()
+    assert detail["current_status"] == status_before
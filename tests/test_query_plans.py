@@ -0,0 +1,114 @@
+"""Every service read path must be servable by an index.
+
+Each case seeds a user with one application, timeline and interview inside
+a transaction that is rolled back, records the SELECTs the read path emits,
+and EXPLAINs them with sequential scans disabled. A Seq Scan left in a plan
+then means no index can serve that query.
+"""
+import json
+import uuid
+from datetime import date
+
+import pytest
+
+READ_PATHS = {
+    "user by email": lambda s, user, job: s.users.get_user_by_email(user.email, s.session),
+    "user jobs offset": lambda s, user, job: s.jobs.get_user_jobs(user.id, s.session, count="exact"),
+    "user jobs filtered": lambda s, user, job: s.jobs.get_user_jobs(user.id, s.session, status=s.Status.SAVED, search="explain", count="exact"),
+    "user jobs keyset": lambda s, user, job: s.jobs.get_user_jobs(user.id, s.session, keyset=True),
+    "all jobs offset": lambda s, user, job: s.jobs.get_all_jobs(s.session, count="none"),
+    "all jobs keyset": lambda s, user, job: s.jobs.get_all_jobs(s.session, keyset=True),
+    "status counts": lambda s, user, job: s.jobs.count_user_jobs_by_status(user.id, s.session),
+    "job detail": lambda s, user, job: s.jobs.get_job(str(job.id), user.id, s.session),
+    "timelines": lambda s, user, job: s.timelines.get_all_timelines_by_app_id(str(job.id), user.id, s.session),
+    "timelines keyset": lambda s, user, job: s.timelines.get_all_timelines_by_app_id(str(job.id), user.id, s.session, page_size=10),
+    "interviews": lambda s, user, job: s.interviews.get_all_interviews_by_app_id(str(job.id), user.id, s.session),
+    "interviews keyset": lambda s, user, job: s.interviews.get_all_interviews_by_app_id(str(job.id), user.id, s.session, page_size=10),
+    "fulltext search": lambda s, user, job: s.search.fulltext_page(user.id, "explain", s.session, 10),
+}
+
+
+def seq_scans(plan: dict):
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from seq_scans(child)
+
+
+class Services:
+    def __init__(self, session) -> None:
+        from src.auth.services import UserService
+        from src.interview.service import JobInterviewService
+        from src.job_application.enums import Status
+        from src.job_application.services import JobApplicationService
+        from src.job_timeline.services import JobTimelineService
+        from src.search.service import SearchService
+
+        self.session = session
+        self.Status = Status
+        self.users = UserService()
+        self.timelines = JobTimelineService()
+        self.jobs = JobApplicationService(self.timelines)
+        self.interviews = JobInterviewService()
+        self.search = SearchService()
+
+
+async def seed(session):
+    from src.db.models import JobApplication, JobInterview, JobTimeline, User
+    from src.interview.schemas import JobInterviewType
+    from src.job_application.enums import Status
+    from src.job_timeline.schemas import JobApplicationEvent
+
+    user = User(username="explain", email=f"explain-{uuid.uuid4()}@example.invalid", first_name="", last_name="", password_hash="")
+    session.add(user)
+    await session.flush()
+    job = JobApplication(job_title="Explain", company_name="Explain", location="", application_date=date.today(), user_uid=user.id)
+    session.add(job)
+    await session.flush()
+    session.add(JobTimeline(job_application_id=job.id, event_type=JobApplicationEvent.SAVED, status=Status.SAVED, event_date=date.today(), notes=""))
+    session.add(JobInterview(job_application_id=job.id, interview_type=JobInterviewType.PHONE, interview_date=date.today(), interviewer_name="", notes=""))
+    await session.flush()
+    return user, job
+
+
+async def explain_read_path(read_path) -> list[tuple[str, list[str]]]:
+    from sqlalchemy import event
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    from src.db.main import async_engine
+
+    captured: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    plans = []
+    async with async_engine.connect() as connection:
+        await connection.begin()
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        user, job = await seed(session)
+
+        event.listen(connection.sync_connection, "before_cursor_execute", capture)
+        await read_path(Services(session), user, job)
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+        await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        for statement, parameters in captured:
+            result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)  # type: ignore[arg-type]
+            plan = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            plans.append((" ".join(statement.split()), sorted(set(seq_scans(plan[0]["Plan"])))))
+
+        await session.close()
+        await connection.rollback()
+    return plans
+
+
+@pytest.mark.parametrize("name", READ_PATHS)
+def test_read_path_uses_indexes(client, name):
+    plans = client.portal.call(explain_read_path, READ_PATHS[name])  # type: ignore[union-attr]
+
+    assert plans
+    scanned = [(tables, statement[:160]) for statement, tables in plans if tables]
+    assert not scanned, f"sequential scans in {name}: {scanned}"
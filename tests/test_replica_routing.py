@@ -0,0 +1,103 @@
+"""Read-only routes use the replica unless the caller has just written.
+
+The replica is a second engine on the test database, opened READ ONLY the
+way src.db.main opens DATABASE_REPLICA_URL, and the pin lives in a fresh
+MemoryStore. Statements are tagged by the engine that ran them.
+"""
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import API, TEST_DATABASE_URL, sign_up
+
+
+@pytest.fixture
+def routed(client, monkeypatch) -> list[str]:
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    import src.db.main as db
+    import src.db.redis as store
+    from src.db.redis import MemoryStore
+
+    engines: list[str] = []
+    listeners = {
+        "primary": lambda *args: engines.append("primary"),
+        "replica": lambda *args: engines.append("replica"),
+    }
+    replica = db.build_engine(TEST_DATABASE_URL)  # type: ignore[arg-type]
+    event.listen(db.async_engine.sync_engine, "before_cursor_execute", listeners["primary"])
+    event.listen(replica.sync_engine, "before_cursor_execute", listeners["replica"])
+
+    read_only = replica.execution_options(postgresql_readonly=True)
+    monkeypatch.setattr(db, "replica_session_maker", async_sessionmaker(bind=read_only, class_=AsyncSession, expire_on_commit=False))
+    monkeypatch.setattr(store, "_store", MemoryStore())
+    db.recent_writers.clear()
+    yield engines
+
+    event.remove(db.async_engine.sync_engine, "before_cursor_execute", listeners["primary"])
+    event.remove(replica.sync_engine, "before_cursor_execute", listeners["replica"])
+    db.recent_writers.clear()
+    client.portal.call(replica.dispose)  # type: ignore[union-attr]
+
+
+def engines_for_read(client, headers, routed) -> set[str]:
+    routed.clear()
+    response = client.get(f"{API}/job_applications/user", headers=headers)
+    assert response.status_code == 200, response.text
+    return set(routed)
+
+
+def mark_write(client, user_id) -> None:
+    from src.db.main import mark_write
+
+    client.portal.call(mark_write, str(user_id))  # type: ignore[union-attr]
+
+
+def advance_clock(monkeypatch, seconds: float) -> None:
+    import src.core.cache as cache
+    import src.db.redis as store
+
+    later = SimpleNamespace(monotonic=lambda: time.monotonic() + seconds)
+    monkeypatch.setattr(cache, "time", later)
+    monkeypatch.setattr(store, "time", later)
+
+
+def test_reads_go_to_the_replica(client, headers, routed):
+    assert engines_for_read(client, headers, routed) == {"replica"}
+
+
+def test_write_pins_the_user_to_the_primary_for_the_window(client, user, routed, monkeypatch):
+    from src.config import Config
+
+    headers, user_id = user
+    mark_write(client, user_id)
+    assert engines_for_read(client, headers, routed) == {"primary"}
+
+    advance_clock(monkeypatch, Config.REPLICA_STICKY_SECONDS + 1)
+    assert engines_for_read(client, headers, routed) == {"replica"}
+
+
+def test_pin_is_shared_with_other_workers(client, user, routed):
+    from src.db.main import recent_writers
+
+    headers, user_id = user
+    mark_write(client, user_id)
+    # another worker never saw the write, only the pin in the shared store
+    recent_writers.clear()
+    assert engines_for_read(client, headers, routed) == {"primary"}
+
+
+def test_pin_is_per_user(client, user, routed):
+    _, writer_id = user
+    other_headers, _ = sign_up(client)
+    mark_write(client, writer_id)
+    assert engines_for_read(client, other_headers, routed) == {"replica"}
+
+
+def test_without_a_replica_reads_use_the_primary(client, headers, routed, monkeypatch):
+    import src.db.main as db
+
+    monkeypatch.setattr(db, "replica_session_maker", None)
+    assert engines_for_read(client, headers, routed) == {"primary"}
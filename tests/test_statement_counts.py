@@ -0,0 +1,91 @@
+"""Statements per request for the main endpoints.
+
+Each endpoint must cost the same number of statements whether the user has
+one application or many, and one timeline or many, so an N+1 or a cascade
+that starts loading relationships fails here. Counts are taken with the
+user and token caches already warm.
+"""
+import pytest
+
+from conftest import API, create_application
+
+SIZES = [1, 8]
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"{size}-rows")
+def seeded(request, client, headers):
+    """A user with ``size`` applications, each with ``size`` timelines and interviews."""
+    size = request.param
+    job_ids = [create_application(client, headers, timelines=size, interviews=size) for _ in range(size)]
+    return headers, job_ids
+
+
+def count(sql, call) -> int:
+    response, statements = sql.run(call)
+    assert response.status_code < 400, response.text
+    return len(statements)
+
+
+def test_me(client, sql, seeded):
+    headers, _ = seeded
+    assert count(sql, lambda: client.get(f"{API}/auth/me", headers=headers)) == 1
+
+
+def test_list_jobs_offset(client, sql, seeded):
+    headers, _ = seeded
+    assert count(sql, lambda: client.get(f"{API}/job_applications/user", headers=headers)) == 2
+
+
+def test_list_jobs_cursor(client, sql, seeded):
+    headers, _ = seeded
+    url = f"{API}/job_applications/user?pagination=cursor"
+    assert count(sql, lambda: client.get(url, headers=headers)) == 1
+
+
+def test_job_detail(client, sql, seeded):
+    headers, job_ids = seeded
+    assert count(sql, lambda: client.get(f"{API}/job_applications/{job_ids[-1]}", headers=headers)) == 3
+
+
+def test_list_timelines(client, sql, seeded):
+    headers, job_ids = seeded
+    url = f"{API}/job-applications/{job_ids[-1]}/job-timelines/"
+    assert count(sql, lambda: client.get(url, headers=headers)) == 1
+
+
+def test_list_interviews(client, sql, seeded):
+    headers, job_ids = seeded
+    url = f"{API}/job-applications/{job_ids[-1]}/interviews/"
+    assert count(sql, lambda: client.get(url, headers=headers)) == 1
+
+
+def test_create_job(client, sql, seeded):
+    headers, _ = seeded
+    body = {"job_title": "Data Engineer", "company_name": "Initech", "location": "Berlin", "application_date": "2025-03-01T00:00:00"}
+    assert count(sql, lambda: client.post(f"{API}/job_applications/", headers=headers, json=body)) == 2
+
+
+def test_create_timeline(client, sql, seeded):
+    headers, job_ids = seeded
+    url = f"{API}/job-applications/{job_ids[-1]}/job-timelines/"
+    body = {"event_type": "REJECTED", "event_date": "2025-03-01T00:00:00", "notes": "no"}
+    assert count(sql, lambda: client.post(url, headers=headers, json=body)) == 4
+
+
+def test_create_timeline_batch(client, sql, seeded):
+    headers, job_ids = seeded
+    url = f"{API}/job-applications/{job_ids[-1]}/job-timelines/batch"
+    body = [{"event_type": "APPLIED", "event_date": "2025-03-01T00:00:00", "notes": "again"}] * len(job_ids)
+    assert count(sql, lambda: client.post(url, headers=headers, json=body)) == 3
+
+
+def test_update_timeline_note(client, sql, seeded):
+    headers, job_ids = seeded
+    timelines = client.get(f"{API}/job-applications/{job_ids[-1]}/job-timelines/", headers=headers).json()
+    url = f"{API}/job-applications/{job_ids[-1]}/job-timelines/{timelines[0]['id']}/note"
+    assert count(sql, lambda: client.patch(url, headers=headers, json="follow up")) == 3
+
+
+def test_delete_job(client, sql, seeded):
+    headers, job_ids = seeded
+    assert count(sql, lambda: client.delete(f"{API}/job_applications/{job_ids[-1]}", headers=headers)) == 1
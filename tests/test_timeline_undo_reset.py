@@ -0,0 +1,69 @@
+"""Undo and reset stay a fixed number of statements however long the history is."""
+import asyncio
+
+import pytest
+
+from conftest import API, create_application
+
+HISTORY_LENGTHS = [2, 20]
+
+
+def timelines_url(job_id: str) -> str:
+    return f"{API}/job-applications/{job_id}/job-timelines"
+
+
+@pytest.mark.parametrize("history", HISTORY_LENGTHS)
+def test_undo_statement_count(client, sql, headers, history):
+    job_id = create_application(client, headers, timelines=history)
+
+    response, statements = sql.run(lambda: client.delete(f"{timelines_url(job_id)}/undo", headers=headers))
+
+    assert response.status_code == 200, response.text
+    # lock the application, delete the newest timeline, resync current_status
+    assert len(statements) == 3
+
+
+@pytest.mark.parametrize("history", HISTORY_LENGTHS)
+def test_reset_statement_count(client, sql, headers, history):
+    job_id = create_application(client, headers, timelines=history)
+
+    response, statements = sql.run(lambda: client.delete(f"{timelines_url(job_id)}/reset", headers=headers))
+
+    assert response.status_code == 200, response.text
+    assert len(statements) == 3
+    assert len(client.get(f"{timelines_url(job_id)}/", headers=headers).json()) == 1
+
+
+def test_concurrent_undos_remove_distinct_timelines(client, headers):
+    from sqlmodel import select
+    from src.db.main import async_session_maker
+    from src.db.models import JobApplication, JobTimeline
+    from src.job_timeline.services import JobTimelineService
+
+    job_id = create_application(client, headers, timelines=3)
+    service = JobTimelineService()
+
+    async def undo_twice():
+        async with async_session_maker() as session:
+            user_id = (await session.exec(select(JobApplication.user_uid).where(JobApplication.id == job_id))).one()
+
+        async def undo():
+            async with async_session_maker() as session:
+                return await service.undo_job_timeline(job_id, user_id, session)
+
+        undone = await asyncio.gather(undo(), undo())
+        async with async_session_maker() as session:
+            remaining = (await session.exec(
+                select(JobTimeline).where(JobTimeline.job_application_id == job_id)
+            )).all()
+            current_status = (await session.exec(
+                select(JobApplication.current_status).where(JobApplication.id == job_id)
+            )).one()
+        return undone, remaining, current_status
+
+    undone, remaining, current_status = client.portal.call(undo_twice)  # type: ignore[union-attr]
+
+    assert undone[0].id != undone[1].id
+    assert len(remaining) == 2
+    newest = max(remaining, key=lambda timeline: (timeline.created_at, timeline.id))
+    assert current_status == newest.status
@@ -0,0 +1,47 @@
+"""verify_token decodes each token once and never outlives its exp."""
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+
+CLAIMS = {"email": "cache@example.com", "user_id": "00000000-0000-0000-0000-000000000001", "user_type": "USER"}
+
+
+@pytest.fixture
+def decodes(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(kwargs.get("jwt", args[0] if args else None))
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    return calls
+
+
+def test_repeated_token_is_decoded_once(decodes):
+    from src.auth.utils import create_access_token, verify_token
+
+    token = create_access_token(CLAIMS)
+
+    first = verify_token(token)
+    second = verify_token(token)
+
+    assert first is not None and first["user"] == CLAIMS
+    assert second == first
+    assert len(decodes) == 1
+
+
+def test_expired_token_is_not_served_from_cache(decodes):
+    from src.auth.utils import create_access_token, verify_token
+
+    token = create_access_token(CLAIMS, expiry=timedelta(seconds=1))
+    token_data = verify_token(token)
+    assert token_data is not None
+
+    time.sleep(max(0.0, token_data["exp"] - time.time()) + 0.1)
+
+    assert verify_token(token) is None
+    assert len(decodes) == 2
@@ -0,0 +1,26 @@
+"""The per-worker user cache must outlive the session that loaded the user."""
+from conftest import API
+
+
+def test_cached_user_survives_rollback_of_loading_session(client, user):
+    from src.auth.services import UserService, user_cache
+    from src.db.main import async_session_maker
+
+    headers, user_id = user
+
+    async def load_then_roll_back():
+        user_cache.pop(user_id)
+        async with async_session_maker() as session:
+            await UserService().get_cached_user_by_id(user_id, session)
+            # a failed flush or commit later in the request ends the same way
+            await session.rollback()
+
+    client.portal.call(load_then_roll_back)  # type: ignore[union-attr]
+    hits = user_cache.hits
+
+    cached = user_cache.get(user_id)
+    assert cached.id == user_id
+    response = client.get(f"{API}/auth/me", headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["id"] == str(user_id)
+    assert user_cache.hits == hits + 2